@@ -124,6 +124,7 @@ class Settings(BaseSettings):
     EMERGENCY_REFILL_COUNT: int = 5  # 紧急补充时并发验证的密钥数量
     POOL_MAINTENANCE_INTERVAL_MINUTES: int = 30  # 密钥池维护间隔（分钟）
     KEY_VALIDATION_GRACE_PERIOD_MINUTES: int = 10 # 密钥验证宽限期（分钟）
+    CONCURRENT_VERIFICATIONS: int = 10  # 密钥池同时进行的密钥验证请求上限（预加载、补充、重新验证共用），与原预加载批次大小一致
 
     # 密钥池使用策略配置
     PRO_MODELS: List[str] = [
@@ -106,6 +106,7 @@ async def get_keys_status(
     pool_status = None
     if hasattr(key_manager, 'valid_key_pool') and key_manager.valid_key_pool:
         pool_status = key_manager.valid_key_pool.get_pool_stats()
+        pool_status.update(key_manager.valid_key_pool.get_pool_rates())
 
     return {
         "keys": {
@@ -140,24 +141,26 @@ async def trigger_pool_maintenance(
             )
 
         # 获取维护前状态
-        before_stats = key_manager.valid_key_pool.get_pool_stats()
+        before_size = len(key_manager.valid_key_pool.valid_keys)
+        before_utilization = key_manager.valid_key_pool.get_pool_rates()["utilization"]
 
         # 执行维护
         await key_manager.valid_key_pool.maintenance()
 
         # 获取维护后状态
-        after_stats = key_manager.valid_key_pool.get_pool_stats()
+        after_size = len(key_manager.valid_key_pool.valid_keys)
+        after_utilization = key_manager.valid_key_pool.get_pool_rates()["utilization"]
 
         return {
             "success": True,
             "message": "Pool maintenance completed successfully",
             "before": {
-                "size": before_stats["current_size"],
-                "utilization": before_stats["utilization"]
+                "size": before_size,
+                "utilization": before_utilization
             },
             "after": {
-                "size": after_stats["current_size"],
-                "utilization": after_stats["utilization"]
+                "size": after_size,
+                "utilization": after_utilization
             }
         }
 
@@ -1,3 +1,4 @@
+import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
@@ -85,14 +86,16 @@ async def maintain_valid_key_pool():
         # 执行池维护操作
         await key_manager.valid_key_pool.maintenance()
 
-        # 获取维护后的统计信息
-        stats = key_manager.valid_key_pool.get_pool_stats()
-        logger.info(
-            f"Valid key pool maintenance completed. "
-            f"Pool size: {stats['current_size']}/{stats['pool_size']}, "
-            f"Hit rate: {stats['hit_rate']:.2%}, "
-            f"Avg key age: {stats['avg_key_age_seconds']}s"
-        )
+        # 获取维护后的统计信息（INFO日志关闭时不计算）
+        if logger.isEnabledFor(logging.INFO):
+            stats = key_manager.valid_key_pool.get_pool_stats()
+            rates = key_manager.valid_key_pool.get_pool_rates()
+            logger.info(
+                f"Valid key pool maintenance completed. "
+                f"Pool size: {stats['current_size']}/{stats['pool_size']}, "
+                f"Hit rate: {rates['hit_rate']:.2%}, "
+                f"Avg key age: {stats['avg_key_age_seconds']}s"
+            )
 
     except Exception as e:
         logger.error(
@@ -18,8 +18,15 @@ def initialize_api_client():
     global _api_client
     if _api_client is None:
         timeout = httpx.Timeout(DEFAULT_TIMEOUT, read=DEFAULT_TIMEOUT)
+        # 所有密钥验证共用一个信号量，同时在途的验证请求最多 CONCURRENT_VERIFICATIONS 个；
+        # 在 httpx 默认上限（100 连接 / 20 保活）之上为其额外预留，突发验证不会挤掉常规请求的保活连接
+        verification_burst = int(settings.CONCURRENT_VERIFICATIONS)
+        limits = httpx.Limits(
+            max_connections=100 + verification_burst,
+            max_keepalive_connections=20 + verification_burst,
+        )
         # 移除默认headers，确保客户端是干净的
-        _api_client = httpx.AsyncClient(timeout=timeout)
+        _api_client = httpx.AsyncClient(timeout=timeout, limits=limits)
         logger.info("Global httpx.AsyncClient initialized without default headers.")
 
 async def close_api_client():
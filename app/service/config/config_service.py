@@ -8,11 +8,11 @@ from typing import Any, Dict, List
 
 from dotenv import find_dotenv, load_dotenv
 from fastapi import HTTPException
-from sqlalchemy import insert, update
+from sqlalchemy import bindparam, insert, update
 
 from app.config.config import Settings as ConfigSettings
 from app.config.config import settings
-from app.database.connection import database
+from app.database.connection import database, engine
 from app.database.models import Settings
 from app.database.services import get_all_settings
 from app.log.logger import get_config_routes_logger
@@ -20,10 +20,28 @@ from app.service.key.key_manager import (
     get_key_manager_instance,
     reset_key_manager_instance,
 )
+from app.service.key.valid_key_pool import clear_model_caches
 from app.service.model.model_service import ModelService
 
 logger = get_config_routes_logger()
 
+# 配置编辑器以字符串提交下拉框的值，这些密钥池配置需要在写入内存前转换为整数
+_POOL_INT_SETTINGS = frozenset({"EMERGENCY_REFILL_COUNT", "CONCURRENT_VERIFICATIONS"})
+
+# 批量更新配置项的参数化语句，由 update(Settings) 按当前数据库方言编译（负责 key 等保留字的引用）。
+# databases 的 execute_many 会对 SQLAlchemy 语句调用 .values(**参数)，无法绑定 WHERE 条件中的参数，
+# 因此编译为命名参数风格的SQL字符串后再批量执行
+_SETTINGS_BULK_UPDATE_QUERY = str(
+    update(Settings)
+    .where(Settings.key == bindparam("setting_key"))
+    .values(
+        value=bindparam("setting_value"),
+        description=bindparam("setting_description"),
+        updated_at=bindparam("setting_updated_at"),
+    )
+    .compile(dialect=type(engine.dialect)(paramstyle="named"))
+)
+
 
 class ConfigService:
     """配置服务类，用于管理应用程序配置"""
@@ -36,8 +54,12 @@ class ConfigService:
     async def update_config(config_data: Dict[str, Any]) -> Dict[str, Any]:
         for key, value in config_data.items():
             if hasattr(settings, key):
+                if key in _POOL_INT_SETTINGS:
+                    value = int(value)
+                    config_data[key] = value
                 setattr(settings, key, value)
                 logger.debug(f"Updated setting in memory: {key}")
+        clear_model_caches()
 
         # 获取现有设置
         existing_settings_raw: List[Dict[str, Any]] = await get_all_settings()
@@ -96,17 +118,19 @@ class ConfigService:
                         )
 
                     if settings_to_update:
-                        for setting_data in settings_to_update:
-                            query_update = (
-                                update(Settings)
-                                .where(Settings.key == setting_data["key"])
-                                .values(
-                                    value=setting_data["value"],
-                                    description=setting_data["description"],
-                                    updated_at=setting_data["updated_at"],
-                                )
-                            )
-                            await database.execute(query=query_update)
+                        # 所有更新共用一条参数化语句，通过 execute_many 批量执行
+                        await database.execute_many(
+                            query=_SETTINGS_BULK_UPDATE_QUERY,
+                            values=[
+                                {
+                                    "setting_key": setting_data["key"],
+                                    "setting_value": setting_data["value"],
+                                    "setting_description": setting_data["description"],
+                                    "setting_updated_at": setting_data["updated_at"],
+                                }
+                                for setting_data in settings_to_update
+                            ],
+                        )
                         logger.info(f"Updated {len(settings_to_update)} settings.")
             except Exception as e:
                 logger.error(f"Failed to bulk update/insert settings: {str(e)}")
@@ -305,3 +329,4 @@ def _reload_settings():
     # 更新现有 settings 对象的属性，而不是新建实例
     for key, value in ConfigSettings().model_dump().items():
         setattr(settings, key, value)
+    clear_model_caches()
@@ -1,5 +1,6 @@
 import asyncio
 import random
+import time
 from itertools import cycle
 from typing import Dict, Union, Optional
 from datetime import datetime, timedelta
@@ -26,7 +27,8 @@ class KeyManager:
         self.vertex_key_failure_counts: Dict[str, int] = {
             key: 0 for key in vertex_api_keys
         }
-        self.key_model_status: Dict[str, Dict[str, datetime]] = {}
+        # 模型冷却截止时间（key -> model -> Unix时间戳），热路径直接与 time.time() 做浮点比较
+        self.key_model_status: Dict[str, Dict[str, float]] = {}
         self.MAX_FAILURES = settings.MAX_FAILURES
         self.paid_key = settings.PAID_KEY
         settings.GEMINI_QUOTA_RESET_HOUR = int(settings.GEMINI_QUOTA_RESET_HOUR)
@@ -47,6 +49,7 @@ class KeyManager:
                 settings.KEY_TTL_HOURS = ttl_hours
                 settings.POOL_MIN_THRESHOLD = int(settings.POOL_MIN_THRESHOLD)
                 settings.EMERGENCY_REFILL_COUNT = int(settings.EMERGENCY_REFILL_COUNT)
+                settings.CONCURRENT_VERIFICATIONS = int(settings.CONCURRENT_VERIFICATIONS)
                 settings.POOL_MAINTENANCE_INTERVAL_MINUTES = int(settings.POOL_MAINTENANCE_INTERVAL_MINUTES)
 
                 self.valid_key_pool = ValidKeyPool(
@@ -155,17 +158,40 @@ class KeyManager:
                 return False
 
             # 2. 检查是否因测试模型而处于冷却状态
-            test_model = settings.TEST_MODEL
-            now = datetime.now(pytz.utc)
-            model_statuses = self.key_model_status.get(key, {})
-            expiry_time = model_statuses.get(test_model)
-            
-            if expiry_time and now < expiry_time:
+            cooldowns = self.key_model_status.get(key)
+            if cooldowns and time.time() < cooldowns.get(settings.TEST_MODEL, 0.0):
                 # 对于测试模型，它正处于冷却期，因此不可用于验证
                 return False
 
             return True
 
+    def filter_keys_available_for_verification(self, keys: list) -> list:
+        """
+        批量检查密钥是否可用于验证。
+        只取一次当前时间，在一次遍历中完成失效和测试模型冷却检查。
+        整个检查是同步的、中间没有await，在事件循环中是原子的，无需获取锁。
+
+        Args:
+            keys: 待检查的密钥列表
+
+        Returns:
+            list: 可用于验证的密钥（保持原有顺序）
+        """
+        now = time.time()
+        failure_counts = self.key_failure_counts
+        key_model_status = self.key_model_status
+        max_failures = self.MAX_FAILURES
+        test_model = settings.TEST_MODEL
+        available = []
+        for key in keys:
+            if failure_counts.get(key, 0) >= max_failures:
+                continue
+            cooldowns = key_model_status.get(key)
+            if cooldowns and now < cooldowns.get(test_model, 0.0):
+                continue
+            available.append(key)
+        return available
+
     async def reset_failure_counts(self):
         """重置所有key的失败计数"""
         async with self.failure_count_lock:
@@ -240,16 +266,15 @@ class KeyManager:
                 return ""
 
             start_index = self.key_index
+            now = time.time()
             for _ in range(len(self.valid_api_keys)):
                 current_key = self.valid_api_keys[self.key_index]
 
                 # 1. 检查特定模型的冷却状态
                 is_in_cooldown = False
                 if model_name:
-                    now = datetime.now(pytz.utc)
-                    model_statuses = self.key_model_status.get(current_key, {})
-                    expiry_time = model_statuses.get(model_name)
-                    if expiry_time and now < expiry_time:
+                    cooldowns = self.key_model_status.get(current_key)
+                    if cooldowns and now < cooldowns.get(model_name, 0.0):
                         logger.info(f"Key {redact_key_for_logging(current_key)} is in cooldown for model {model_name}. Skipping.")
                         is_in_cooldown = True
 
@@ -307,7 +332,8 @@ class KeyManager:
         if api_key not in self.key_model_status:
             self.key_model_status[api_key] = {}
         
-        self.key_model_status[api_key][model_name] = next_reset_time.astimezone(pytz.utc)
+        # 存储为时间戳，检查冷却时无需构造带时区的 datetime
+        self.key_model_status[api_key][model_name] = next_reset_time.timestamp()
         logger.info(f"Key {api_key} for model {model_name} has been put into cooldown until {next_reset_time} ({settings.TIMEZONE}).")
 
     async def mark_key_as_failed(self, api_key: str):
@@ -457,22 +483,8 @@ class KeyManager:
                 logger.debug(f"Removed '{redact_key_for_logging(key_to_remove)}' from model status.")
 
             # 4. 从有效密钥池中移除
-            if self.valid_key_pool and self.valid_key_pool.valid_keys:
-                initial_pool_size = len(self.valid_key_pool.valid_keys)
-                # 保持deque类型，不要转换为list
-                from collections import deque
-                filtered_keys = deque(
-                    key_obj for key_obj in self.valid_key_pool.valid_keys if key_obj.key != key_to_remove
-                )
-                self.valid_key_pool.valid_keys = filtered_keys
-
-                # 同时从_pool_keys_set中移除
-                if hasattr(self.valid_key_pool, '_pool_keys_set') and key_to_remove in self.valid_key_pool._pool_keys_set:
-                    self.valid_key_pool._pool_keys_set.remove(key_to_remove)
-
-                removed_count = initial_pool_size - len(self.valid_key_pool.valid_keys)
-                if removed_count > 0:
-                    logger.debug(f"Removed {removed_count} instance(s) of '{redact_key_for_logging(key_to_remove)}' from ValidKeyPool.")
+            if self.valid_key_pool and self.valid_key_pool.remove_key(key_to_remove):
+                logger.debug(f"Removed '{redact_key_for_logging(key_to_remove)}' from ValidKeyPool.")
 
             # 5. 重置索引（如果需要）
             if self.key_index >= len(self.valid_api_keys) and self.valid_api_keys:
@@ -508,19 +520,7 @@ class KeyManager:
         """
         if self.valid_key_pool and self.valid_key_pool.valid_keys:
             async with self.failure_count_lock: # Use a lock to protect pool access
-                initial_pool_size = len(self.valid_key_pool.valid_keys)
-                
-                from collections import deque
-                filtered_keys = deque(
-                    key_obj for key_obj in self.valid_key_pool.valid_keys if key_obj.key != key_to_remove
-                )
-                
-                if len(filtered_keys) < initial_pool_size:
-                    self.valid_key_pool.valid_keys = filtered_keys
-                    
-                    if hasattr(self.valid_key_pool, '_pool_keys_set') and key_to_remove in self.valid_key_pool._pool_keys_set:
-                        self.valid_key_pool._pool_keys_set.remove(key_to_remove)
-                    
+                if self.valid_key_pool.remove_key(key_to_remove):
                     logger.info(f"Key '{redact_key_for_logging(key_to_remove)}' temporarily removed from ValidKeyPool.")
                     return True
         return False
@@ -743,7 +743,7 @@ async def get_key_manager_instance(
                     for key_obj in _preserved_valid_key_pool_keys:
                         # 检查密钥是否仍然有效且在新的密钥列表中
                         if key_obj.key in _singleton_instance.api_keys and not key_obj.is_expired():
-                            _singleton_instance.valid_key_pool.valid_keys.append(key_obj)
+                            _singleton_instance.valid_key_pool.append_key(key_obj)
 
                     restored_count = len(_singleton_instance.valid_key_pool.valid_keys)
                     logger.info(f"Restored {restored_count} keys to ValidKeyPool after config update")
@@ -825,9 +825,9 @@ async def reset_key_manager_instance():
             # 5. 保存有效密钥池状态
             try:
                 if _singleton_instance.valid_key_pool:
-                    _preserved_valid_key_pool_stats = _singleton_instance.valid_key_pool.stats.copy()
+                    _preserved_valid_key_pool_stats = _singleton_instance.valid_key_pool.stats
                     if _singleton_instance.valid_key_pool.valid_keys:
-                        _preserved_valid_key_pool_keys = list(_singleton_instance.valid_key_pool.valid_keys)
+                        _preserved_valid_key_pool_keys = list(_singleton_instance.valid_key_pool.valid_keys.values())
                         logger.info(f"Preserved {len(_preserved_valid_key_pool_keys)} keys and stats from ValidKeyPool")
                     else:
                         _preserved_valid_key_pool_keys = None
@@ -3,7 +3,9 @@
 定义带TTL的有效密钥数据类
 """
 from datetime import datetime, timedelta
+import logging
 import random
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -12,7 +14,7 @@ from app.log.logger import get_key_manager_logger
 logger = get_key_manager_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidKeyWithTTL:
     """
     带TTL的有效密钥数据类
@@ -21,9 +23,8 @@ class ValidKeyWithTTL:
     提供TTL管理、过期检查和使用计数功能
     """
     key: str
-    created_at: datetime
-    expires_at: datetime
-    ttl_hours: int = 2
+    created_at_monotonic: float  # 创建时的单调时钟时间，供批量计算年龄使用
+    expires_at_monotonic: float  # 过期时的单调时钟时间，过期检查只需一次浮点比较，不受系统时间调整影响
     usage_count: int = 0  # 使用计数器
     max_usage_count: int = -1  # 最大使用次数，-1表示无限制
 
@@ -37,30 +38,50 @@ class ValidKeyWithTTL:
             max_usage_count: 最大使用次数，-1表示无限制
         """
         self.key = key
-        self.ttl_hours = ttl_hours
         self.max_usage_count = max_usage_count
         self.usage_count = 0
-        self.created_at = datetime.now()
+        self.created_at_monotonic = time.monotonic()
         # 添加TTL抖动，防止所有密钥同时过期
         jitter_percentage = 0.10  # ±10%
         ttl_seconds = ttl_hours * 3600
         jitter_seconds = random.uniform(-ttl_seconds * jitter_percentage, ttl_seconds * jitter_percentage)
-        self.expires_at = self.created_at + timedelta(hours=ttl_hours, seconds=jitter_seconds)
+        self.expires_at_monotonic = self.created_at_monotonic + ttl_seconds + jitter_seconds
 
-        logger.debug(f"Created ValidKeyWithTTL for key {key[:8]}..., expires at {self.expires_at}, max_usage: {max_usage_count}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created ValidKeyWithTTL for key %s..., expires at %s, max_usage: %s", key[:8], self.expires_at, max_usage_count)
+
+    @property
+    def created_at(self) -> datetime:
+        """创建时间（由单调时钟时间按需换算为墙上时间，仅用于展示）"""
+        return datetime.fromtimestamp(time.time() - (time.monotonic() - self.created_at_monotonic))
+
+    @property
+    def expires_at(self) -> datetime:
+        """过期时间（由单调时钟时间按需换算为墙上时间，仅用于展示）"""
+        return datetime.fromtimestamp(time.time() + (self.expires_at_monotonic - time.monotonic()))
+
+    @property
+    def ttl_hours(self) -> float:
+        """实际生存时间（小时，含抖动），由两个时间戳推导，不单独存储"""
+        return (self.expires_at_monotonic - self.created_at_monotonic) / 3600
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """
         检查密钥是否已过期
 
+        Args:
+            now: 当前单调时钟时间，批量检查时由调用方传入以避免重复取时间
+
         Returns:
             bool: 如果已过期返回True，否则返回False
         """
-        now = datetime.now()
-        expired = now > self.expires_at
+        if now is None:
+            now = time.monotonic()
+        expired = now > self.expires_at_monotonic
 
-        if expired:
-            logger.debug(f"Key {self.key[:8]}... has expired at {self.expires_at}")
+        # 每次命中池都会调用，DEBUG关闭时跳过过期时间的换算和日志格式化
+        if expired and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key %s... has expired at %s", self.key[:8], self.expires_at)
 
         return expired
 
@@ -76,8 +97,8 @@ class ValidKeyWithTTL:
 
         exhausted = self.usage_count >= self.max_usage_count
 
-        if exhausted:
-            logger.debug(f"Key {self.key[:8]}... usage exhausted: {self.usage_count}/{self.max_usage_count}")
+        if exhausted and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key %s... usage exhausted: %s/%s", self.key[:8], self.usage_count, self.max_usage_count)
 
         return exhausted
 
@@ -89,7 +110,9 @@ class ValidKeyWithTTL:
             int: 当前使用次数
         """
         self.usage_count += 1
-        logger.debug(f"Key {self.key[:8]}... usage incremented to {self.usage_count}/{self.max_usage_count if self.max_usage_count != -1 else '∞'}")
+        # 每次命中池都会调用，DEBUG关闭时跳过日志字符串的格式化
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key %s... usage incremented to %s/%s", self.key[:8], self.usage_count, self.max_usage_count if self.max_usage_count != -1 else '∞')
         return self.usage_count
 
     def reset_usage(self) -> None:
@@ -98,7 +121,7 @@ class ValidKeyWithTTL:
         """
         old_count = self.usage_count
         self.usage_count = 0
-        logger.debug(f"Key {self.key[:8]}... usage reset from {old_count} to 0")
+        logger.debug("Key %s... usage reset from %s to 0", self.key[:8], old_count)
 
     def can_be_used(self) -> bool:
         """
@@ -116,10 +139,10 @@ class ValidKeyWithTTL:
         Returns:
             timedelta: 剩余时间，如果已过期则返回负值
         """
-        now = datetime.now()
-        remaining = self.expires_at - now
+        remaining = timedelta(seconds=self.expires_at_monotonic - time.monotonic())
         
-        logger.debug(f"Key {self.key[:8]}... has {remaining} remaining time")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key %s... has %s remaining time", self.key[:8], remaining)
         
         return remaining
     
@@ -142,24 +165,22 @@ class ValidKeyWithTTL:
         Returns:
             int: 从创建到现在的秒数
         """
-        now = datetime.now()
-        age = now - self.created_at
-        return int(age.total_seconds())
+        return int(time.monotonic() - self.created_at_monotonic)
     
     def refresh_ttl(self, new_ttl_hours: Optional[int] = None) -> None:
         """
         刷新TTL，重新设置过期时间
         
         Args:
-            new_ttl_hours: 新的TTL小时数，如果为None则使用原有TTL
+            new_ttl_hours: 新的TTL小时数，如果为None则沿用原有生存时间
         """
-        if new_ttl_hours is not None:
-            self.ttl_hours = new_ttl_hours
-        
-        self.created_at = datetime.now()
-        self.expires_at = self.created_at + timedelta(hours=self.ttl_hours)
+        ttl_seconds = self.expires_at_monotonic - self.created_at_monotonic if new_ttl_hours is None else new_ttl_hours * 3600
+
+        self.created_at_monotonic = time.monotonic()
+        self.expires_at_monotonic = self.created_at_monotonic + ttl_seconds
         
-        logger.debug(f"Refreshed TTL for key {self.key[:8]}..., new expiry: {self.expires_at}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Refreshed TTL for key %s..., new expiry: %s", self.key[:8], self.expires_at)
     
     def __str__(self) -> str:
         """字符串表示"""
@@ -170,7 +191,7 @@ class ValidKeyWithTTL:
         return (f"ValidKeyWithTTL(key='{self.key[:8]}...', "
                 f"created_at={self.created_at}, "
                 f"expires_at={self.expires_at}, "
-                f"ttl_hours={self.ttl_hours})")
+                f"ttl_hours={self.ttl_hours:.2f})")
     
     def to_dict(self) -> dict:
         """
@@ -183,7 +204,7 @@ class ValidKeyWithTTL:
             "key_prefix": self.key[:8] + "...",
             "created_at": self.created_at.isoformat(),
             "expires_at": self.expires_at.isoformat(),
-            "ttl_hours": self.ttl_hours,
+            "ttl_hours": round(self.ttl_hours, 2),
             "usage_count": self.usage_count,
             "max_usage_count": self.max_usage_count,
             "is_expired": self.is_expired(),
@@ -3,9 +3,15 @@
 实现智能密钥池管理，包括TTL机制、异步验证补充、紧急恢复等功能
 """
 import asyncio
+import logging
 import random
-from collections import deque
-from typing import Optional, Dict, Any
+import re
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime
 import time
 
@@ -15,10 +21,116 @@ from app.service.key.valid_key_models import ValidKeyWithTTL
 from app.domain.gemini_models import GeminiRequest, GeminiContent
 from app.handler.error_processor import handle_api_error_and_get_next_key
 from app.utils.helpers import redact_key_for_logging
+from app.utils.ttl_cache import TTLCache
 
 logger = get_key_manager_logger()
 
 
+def _monotonic_to_iso(timestamp: Optional[float]) -> Optional[str]:
+    """
+    将 time.monotonic() 时间戳转换为本地时间的ISO字符串
+
+    Args:
+        timestamp: 单调时钟时间戳，None表示尚未记录
+
+    Returns:
+        Optional[str]: ISO格式时间字符串
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - timestamp)).isoformat()
+
+
+# stats 字典的键名；对应计数器保存在同名加下划线前缀的槽属性中
+_STATS_KEYS: Tuple[str, ...] = (
+    "hit_count",
+    "miss_count",
+    "emergency_refill_count",
+    "expired_keys_removed",
+    "total_verifications",
+    "successful_verifications",
+    "maintenance_count",
+    "preload_count",
+    "fallback_count",
+    "verification_failures",
+    "usage_exhausted_keys_removed",
+    "ttl_evictions",
+    "pro_model_requests",
+    "non_pro_model_requests",
+)
+_STATS_KEY_SET = frozenset(_STATS_KEYS)
+# 近期命中率的指数加权平滑系数（与TCP RTT估计相同的 1/8）
+_HIT_RATE_EWMA_ALPHA = 0.125
+_HIT_RATE_EWMA_DECAY = 1.0 - _HIT_RATE_EWMA_ALPHA
+# 一次C级调用读取全部计数器，按 _STATS_KEYS 顺序返回元组
+_read_stats_counters = attrgetter(*(f"_{name}" for name in _STATS_KEYS))
+
+
+@lru_cache(maxsize=1)
+def _pro_model_pattern() -> Optional["re.Pattern[str]"]:
+    """
+    将 settings.PRO_MODELS 编译为单个正则交替式，一次扫描即可完成所有子串匹配
+
+    Returns:
+        Optional[re.Pattern[str]]: 编译后的正则；PRO_MODELS 为空时返回None
+    """
+    if not settings.PRO_MODELS:
+        return None
+    return re.compile("|".join(re.escape(pro_model) for pro_model in settings.PRO_MODELS))
+
+
+@lru_cache(maxsize=256)
+def _is_pro_model_name(model_name: str) -> bool:
+    """
+    判断模型名称是否属于Pro模型（按模型名称缓存结果）
+
+    结果依赖 settings.PRO_MODELS，配置变更后需调用 clear_model_caches()
+
+    Args:
+        model_name: 模型名称
+
+    Returns:
+        bool: 如果是Pro模型返回True，否则返回False
+    """
+    # 移除模型名称中的后缀
+    clean_model = model_name
+    if clean_model.endswith("-search"):
+        clean_model = clean_model[:-7]
+    if clean_model.endswith("-image"):
+        clean_model = clean_model[:-6]
+    if clean_model.endswith("-non-thinking"):
+        clean_model = clean_model[:-13]
+
+    # 检查是否包含Pro模型列表中的任一名称
+    pattern = _pro_model_pattern()
+    return pattern is not None and pattern.search(clean_model) is not None
+
+
+@lru_cache(maxsize=64)
+def _max_usage_for_model_name(model_name: Optional[str]) -> int:
+    """
+    根据模型类型获取最大使用次数（按模型名称缓存结果）
+
+    结果依赖 settings 中的使用次数配置，配置变更后需调用 clear_model_caches()
+
+    Args:
+        model_name: 模型名称，为空时按非Pro模型处理
+
+    Returns:
+        int: 最大使用次数
+    """
+    if model_name and _is_pro_model_name(model_name):
+        return getattr(settings, 'PRO_MODEL_MAX_USAGE', 5)
+    return getattr(settings, 'NON_PRO_MODEL_MAX_USAGE', 20)
+
+
+def clear_model_caches() -> None:
+    """清空按模型名称缓存的判断结果，在配置更新或重新加载后调用"""
+    _pro_model_pattern.cache_clear()
+    _is_pro_model_name.cache_clear()
+    _max_usage_for_model_name.cache_clear()
+
+
 class ValidKeyPool:
     """
     有效密钥池核心管理类
@@ -29,7 +141,59 @@ class ValidKeyPool:
     - 紧急恢复和快速填充
     - 统计监控和日志记录
     """
-    
+
+    # get_valid_key 单次调用最多丢弃的过期密钥数，超过后直接进入紧急恢复
+    _MAX_EXPIRED_PER_CALL = 16
+
+    __slots__ = (
+        "pool_size",
+        "ttl_hours",
+        "key_manager",
+        "valid_keys",
+        "_sum_created",
+        "_created_sorted",
+        "_expires_sorted",
+        "_verification_futures",
+        "_refill_candidates",
+        "_refill_candidate_index",
+        "_warm_spares",
+        "verification_semaphore",
+        "emergency_lock",
+        "_emergency_refill_task",
+        "chat_service",
+        "_min_threshold",
+        "_refill_tokens",
+        "_refill_rate",
+        "_refill_last_monotonic",
+        "_empty_stats_template",
+        "_stats_cache",
+        # 统计计数器
+        "_hit_count",
+        "_miss_count",
+        "_total_requests",
+        "_emergency_refill_count",
+        "_expired_keys_removed",
+        "_total_verifications",
+        "_successful_verifications",
+        "_maintenance_count",
+        "_preload_count",
+        "_fallback_count",
+        "_verification_failures",
+        "_usage_exhausted_keys_removed",
+        "_ttl_evictions",
+        "_pro_model_requests",
+        "_non_pro_model_requests",
+        # 性能监控
+        "_last_hit_monotonic",
+        "_last_miss_monotonic",
+        "_last_maintenance_monotonic",
+        "_total_get_key_calls",
+        "_sum_verification_time",
+        "_hit_rate_ewma",
+        "_served_keys",
+        "_verification_samples",
+    )
+
     def __init__(self, pool_size: int, ttl_hours: int, key_manager):
         """
         初始化有效密钥池
@@ -42,92 +206,129 @@ class ValidKeyPool:
         self.pool_size = pool_size
         self.ttl_hours = ttl_hours
         self.key_manager = key_manager
-        self.valid_keys: deque[ValidKeyWithTTL] = deque(maxlen=pool_size)
-        self._pool_keys_set: set[str] = set()
-        concurrent_verifications = getattr(settings, 'CONCURRENT_VERIFICATIONS', 1)
+        # 密钥 -> 密钥对象，按入池顺序排列：既是轮转队列也是O(1)成员索引
+        self.valid_keys: "OrderedDict[str, ValidKeyWithTTL]" = OrderedDict()
+        # 池内密钥创建时间的增量聚合，get_pool_stats 无需遍历整个池
+        self._sum_created = 0.0
+        self._created_sorted: List[float] = []
+        # 池内密钥过期时间戳的有序列表，首元素即最早过期时间，过期清理可据此提前返回
+        self._expires_sorted: List[float] = []
+        # 池满时为更新鲜的密钥让位而被淘汰、但仍未过期的密钥，下次未命中时直接使用；备用期间不作为补充候选
+        self._warm_spares: deque[ValidKeyWithTTL] = deque(maxlen=max(1, int(getattr(settings, 'EMERGENCY_REFILL_COUNT', 5))))
+        # 不在池中且不是备用密钥的密钥组成的索引集合（列表 + 位置字典），随机抽取和增删均为 O(1)
+        self._refill_candidates: List[str] = []
+        self._refill_candidate_index: Dict[str, int] = {}
+        self._reset_refill_candidates()
+        # 正在验证中的密钥及其结果 future，同一密钥的并发验证合并为一次请求
+        self._verification_futures: Dict[str, asyncio.Future] = {}
+        # 配置编辑器以字符串提交下拉框的值，这里统一转换为整数
+        concurrent_verifications = int(settings.CONCURRENT_VERIFICATIONS)
         self.verification_semaphore = asyncio.Semaphore(concurrent_verifications)
-        logger.info(f"Verification semaphore initialized with {concurrent_verifications} concurrent tasks.")
+        logger.info("Verification semaphore initialized with %s concurrent tasks.", concurrent_verifications)
         self.emergency_lock = asyncio.Lock()     # 紧急补充锁
+        self._emergency_refill_task: Optional[asyncio.Task] = None  # 在途的紧急补充任务
         self.chat_service = None
-        
-        # 统计信息
-        self.stats = {
-            "hit_count": 0,
-            "miss_count": 0,
-            "emergency_refill_count": 0,
-            "expired_keys_removed": 0,
-            "total_verifications": 0,
-            "successful_verifications": 0,
-            "maintenance_count": 0,
-            "preload_count": 0,
-            "fallback_count": 0,
-            "verification_failures": 0,
-            "usage_exhausted_keys_removed": 0,  # 新增：因使用次数耗尽而移除的密钥数
-            "pro_model_requests": 0,  # 新增：Pro模型请求数
-            "non_pro_model_requests": 0  # 新增：非Pro模型请求数
-        }
 
-        # 性能监控
-        self.performance_stats = {
-            "last_hit_time": None,
-            "last_miss_time": None,
-            "last_maintenance_time": None,
-            "total_get_key_calls": 0,
-            "avg_verification_time": 0.0
+        self._min_threshold = int(getattr(settings, 'POOL_MIN_THRESHOLD', 10))
+        # 循序补充的令牌桶：容量为1，每5秒恢复一个令牌
+        self._refill_tokens = 1.0
+        self._refill_rate = 1.0 / 5.0
+        self._refill_last_monotonic = time.monotonic()
+
+        # 池为空时 get_pool_stats 直接复用的模板
+        self._empty_stats_template: Dict[str, Any] = {
+            "pool_size": pool_size,
+            "current_size": 0,
+            "ttl_hours": ttl_hours,
+            "avg_key_age_seconds": 0,
+            "max_key_age_seconds": 0,
+            "min_key_age_seconds": 0,
         }
-        
-        logger.info(f"ValidKeyPool initialized with pool_size={pool_size}, ttl_hours={ttl_hours}")
-
-    def set_chat_service(self, chat_service):
-        """设置聊天服务实例"""
-        self.chat_service = chat_service
-        logger.debug("Chat service set for ValidKeyPool")
-
-    def _is_pro_model(self, model_name: str) -> bool:
+        # get_pool_stats 结果的短期缓存，池内容变化时失效
+        self._stats_cache = TTLCache(ttl_seconds=1)
+
+        # 统计信息与性能监控（以槽属性保存，stats/performance_stats 按需构建字典）
+        # 已返回过的不同密钥（受配置的密钥列表限制，精确计数），只创建一次，重置统计时原地清空
+        self._served_keys: Set[str] = set()
+        self._init_stats()
+
+        logger.info("ValidKeyPool initialized with pool_size=%s, ttl_hours=%s", pool_size, ttl_hours)
+
+    def _init_stats(self) -> None:
+        """初始化所有统计计数器和性能监控字段"""
+        self._hit_count = 0
+        self._miss_count = 0
+        self._total_requests = 0  # hit_count + miss_count，随命中/未命中同步累加
+        self._emergency_refill_count = 0
+        self._expired_keys_removed = 0
+        self._total_verifications = 0
+        self._successful_verifications = 0
+        self._maintenance_count = 0
+        self._preload_count = 0
+        self._fallback_count = 0
+        self._verification_failures = 0
+        self._usage_exhausted_keys_removed = 0  # 因使用次数耗尽而移除的密钥数
+        self._ttl_evictions = 0  # 池满时为更新鲜的密钥让位而淘汰的密钥数
+        self._pro_model_requests = 0  # Pro模型请求数
+        self._non_pro_model_requests = 0  # 非Pro模型请求数
+
+        self._last_hit_monotonic: Optional[float] = None
+        self._last_miss_monotonic: Optional[float] = None
+        self._last_maintenance_monotonic: Optional[float] = None
+        self._total_get_key_calls = 0
+        self._sum_verification_time = 0.0  # 平均验证时间在读取时由总和与样本数求得
+        self._hit_rate_ewma = 0.0  # 近期命中率，每次命中/未命中做一次乘加，对最近的变化敏感
+        self._served_keys.clear()
+        self._verification_samples = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
         """
-        判断是否为Pro模型
-
-        Args:
-            model_name: 模型名称
+        统计计数器快照
 
         Returns:
-            bool: 如果是Pro模型返回True，否则返回False
+            Dict[str, int]: 每次调用新建的计数器字典
         """
-        if not model_name:
-            return False
-
-        # 移除模型名称中的后缀
-        clean_model = model_name
-        if clean_model.endswith("-search"):
-            clean_model = clean_model[:-7]
-        if clean_model.endswith("-image"):
-            clean_model = clean_model[:-6]
-        if clean_model.endswith("-non-thinking"):
-            clean_model = clean_model[:-13]
+        return dict(zip(_STATS_KEYS, _read_stats_counters(self)))
 
-        # 检查是否在Pro模型列表中
-        is_pro = any(pro_model in clean_model for pro_model in settings.PRO_MODELS)
-
-        if is_pro:
-            logger.debug(f"Model {model_name} identified as Pro model")
-
-        return is_pro
-
-    def _get_max_usage_for_model(self, model_name: str) -> int:
+    @stats.setter
+    def stats(self, value: Dict[str, int]) -> None:
         """
-        根据模型类型获取最大使用次数
+        从字典恢复统计计数器（用于配置更新后恢复池状态）
 
         Args:
-            model_name: 模型名称
+            value: 计数器字典，未知的键会被忽略
+        """
+        for name, count in value.items():
+            if name in _STATS_KEY_SET:
+                setattr(self, f"_{name}", count)
+        self._total_requests = self._hit_count + self._miss_count
+        self._stats_cache.remove("stats")
+
+    @property
+    def performance_stats(self) -> Dict[str, Any]:
+        """
+        性能监控快照
+
+        last_*_time 以单调时钟保存，仅在此处转换为ISO字符串
 
         Returns:
-            int: 最大使用次数
+            Dict[str, Any]: 每次调用新建的性能监控字典
         """
-        if self._is_pro_model(model_name):
-            return getattr(settings, 'PRO_MODEL_MAX_USAGE', 5)
-        else:
-            return getattr(settings, 'NON_PRO_MODEL_MAX_USAGE', 20)
-    
+        return {
+            "last_hit_time": _monotonic_to_iso(self._last_hit_monotonic),
+            "last_miss_time": _monotonic_to_iso(self._last_miss_monotonic),
+            "last_maintenance_time": _monotonic_to_iso(self._last_maintenance_monotonic),
+            "total_get_key_calls": self._total_get_key_calls,
+            "avg_verification_time": self._sum_verification_time / self._verification_samples if self._verification_samples else 0.0,
+            "hit_rate_ewma": self._hit_rate_ewma,
+        }
+
+    def set_chat_service(self, chat_service):
+        """设置聊天服务实例"""
+        self.chat_service = chat_service
+        logger.debug("Chat service set for ValidKeyPool")
+
     async def get_valid_key(self, model_name: str = None) -> str:
         """
         获取有效密钥，同时触发异步补充
@@ -138,126 +339,177 @@ class ValidKeyPool:
         Returns:
             str: 有效的API密钥
         """
-        self.performance_stats["total_get_key_calls"] += 1
+        self._total_get_key_calls += 1
 
-        # 记录模型请求统计
+        # 记录模型请求统计：计数器均为普通整数属性；热路径直接调用按模型名称缓存的判断函数
         if model_name:
-            if self._is_pro_model(model_name):
-                self.stats["pro_model_requests"] += 1
+            if _is_pro_model_name(model_name):
+                self._pro_model_requests += 1
             else:
-                self.stats["non_pro_model_requests"] += 1
+                self._non_pro_model_requests += 1
 
-        # 清理过期密钥
-        expired_count = self._remove_expired_keys()
-
-        # 尝试从池中获取有效密钥
-        while self.valid_keys:
-            key_obj = self.valid_keys.popleft()
-            self._pool_keys_set.discard(key_obj.key)
+        # 尝试从池中获取有效密钥（循环内没有await，取出与放回之间不会被其他协程打断）
+        # 过期密钥在出队时顺带丢弃，全量过期清理由 maintenance() 负责
+        valid_keys = self.valid_keys
+        now = time.monotonic()
+        expired_count = 0
+        while expired_count < self._MAX_EXPIRED_PER_CALL:
+            try:
+                _, key_obj = valid_keys.popitem(last=False)
+            except KeyError:
+                break
 
             # 检查密钥是否可以使用（未过期）
-            if not key_obj.is_expired():
+            if not key_obj.is_expired(now):
                 # 增加使用计数
                 key_obj.increment_usage()
 
-                self.stats["hit_count"] += 1
-                self.performance_stats["last_hit_time"] = datetime.now()
+                self._hit_count += 1
+                self._total_requests += 1
+                self._hit_rate_ewma = self._hit_rate_ewma * _HIT_RATE_EWMA_DECAY + _HIT_RATE_EWMA_ALPHA
+                self._last_hit_monotonic = time.monotonic()
 
                 # 检查当前模型的使用次数限制
-                max_usage_for_model = self._get_max_usage_for_model(model_name) if model_name else getattr(settings, 'NON_PRO_MODEL_MAX_USAGE', 20)
+                max_usage_for_model = _max_usage_for_model_name(model_name)
                 usage_limit_reached = False
 
                 if max_usage_for_model > 0 and key_obj.usage_count >= max_usage_for_model:
                     usage_limit_reached = True
-                    self.stats["usage_exhausted_keys_removed"] += 1
+                    self._usage_exhausted_keys_removed += 1
 
                 # 如果密钥未达到当前模型的使用限制，放回池中
                 if not usage_limit_reached:
-                    self.valid_keys.append(key_obj)
-                    self._pool_keys_set.add(key_obj.key)
-
-                    # 记录详细的命中日志（密钥放回池中后）
-                    hit_rate = self.stats["hit_count"] / (self.stats["hit_count"] + self.stats["miss_count"]) if (self.stats["hit_count"] + self.stats["miss_count"]) > 0 else 0
-                    usage_limit_str = str(max_usage_for_model)
-                    logger.info(f"Pool hit: returned key {redact_key_for_logging(key_obj.key)}, "
-                               f"usage: {key_obj.usage_count}/{usage_limit_str}, "
-                               f"pool size: {len(self.valid_keys)}, hit rate: {hit_rate:.2%}")
+                    valid_keys[key_obj.key] = key_obj
+
+                    # 记录详细的命中日志（密钥放回池中后）；INFO关闭时跳过密钥脱敏和命中率计算
+                    if logger.isEnabledFor(logging.INFO):
+                        hit_rate = self._hit_count / self._total_requests
+                        logger.info("Pool hit: returned key %s, "
+                                   "usage: %s/%s, "
+                                   "pool size: %s, hit rate: %.2f%%",
+                                   redact_key_for_logging(key_obj.key), key_obj.usage_count, max_usage_for_model, len(self.valid_keys), hit_rate * 100)
                 else:
                     # 使用次数已达到当前模型限制，不放回池中
-                    hit_rate = self.stats["hit_count"] / (self.stats["hit_count"] + self.stats["miss_count"]) if (self.stats["hit_count"] + self.stats["miss_count"]) > 0 else 0
-                    usage_limit_str = str(max_usage_for_model)
-                    logger.info(f"Pool hit: returned key {redact_key_for_logging(key_obj.key)}, "
-                               f"usage: {key_obj.usage_count}/{usage_limit_str}, "
-                               f"pool size: {len(self.valid_keys)}, hit rate: {hit_rate:.2%} - REMOVED (usage limit reached)")
+                    self._untrack_key(key_obj)
+                    if logger.isEnabledFor(logging.INFO):
+                        hit_rate = self._hit_count / self._total_requests
+                        logger.info("Pool hit: returned key %s, "
+                                   "usage: %s/%s, "
+                                   "pool size: %s, hit rate: %.2f%% - REMOVED (usage limit reached)",
+                                   redact_key_for_logging(key_obj.key), key_obj.usage_count, max_usage_for_model, len(self.valid_keys), hit_rate * 100)
 
                     # 只有在key被移出池子时才触发补充
                     self._trigger_refill_on_key_removal(model_name)
 
+                self._served_keys.add(key_obj.key)
                 return key_obj.key
             else:
                 # 密钥已过期
-                self.stats["expired_keys_removed"] += 1
-                logger.debug(f"Removed expired key {redact_key_for_logging(key_obj.key)}")
+                self._untrack_key(key_obj)
+                self._expired_keys_removed += 1
+                expired_count += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Removed expired key %s", redact_key_for_logging(key_obj.key))
 
                 # 过期密钥被移除时也触发补充
                 self._trigger_refill_on_key_removal(model_name)
 
-        # 池为空或严重不足，记录miss并进入紧急恢复模式
-        self.stats["miss_count"] += 1
-        self.performance_stats["last_miss_time"] = datetime.now()
+        # 池为空、严重不足或连续遇到过多过期密钥，记录miss并进入紧急恢复模式
+        self._miss_count += 1
+        self._total_requests += 1
+        self._hit_rate_ewma *= _HIT_RATE_EWMA_DECAY
+        self._last_miss_monotonic = time.monotonic()
+
+        miss_rate = self._miss_count / self._total_requests
+        logger.warning("ValidKeyPool miss: pool size %s, entering emergency refill mode, "
+                      "miss rate: %.2f%%, expired removed: %s",
+                      len(self.valid_keys), miss_rate * 100, expired_count)
+
+        # 优先使用池满时被淘汰下来的备用密钥，避免再次进入紧急恢复
+        spare = self._take_warm_spare()
+        if spare is not None:
+            spare.increment_usage()
+            # 与命中路径相同的模型使用次数限制：达到上限的备用密钥不再放回池中
+            max_usage_for_model = _max_usage_for_model_name(model_name)
+            if max_usage_for_model > 0 and spare.usage_count >= max_usage_for_model:
+                self._usage_exhausted_keys_removed += 1
+                self._restore_refill_candidate(spare.key)
+            else:
+                self.append_key(spare)
+            logger.info("Serving warm spare key %s on pool miss", redact_key_for_logging(spare.key))
+            self._schedule_emergency_refill()
+            self._served_keys.add(spare.key)
+            return spare.key
+
+        key = await self.emergency_refill(model_name)
+        if key:
+            self._served_keys.add(key)
+        return key
+
+    def _take_warm_spare(self) -> Optional[ValidKeyWithTTL]:
+        """
+        取出一个未过期且不在池中的备用密钥
 
-        miss_rate = self.stats["miss_count"] / (self.stats["hit_count"] + self.stats["miss_count"]) if (self.stats["hit_count"] + self.stats["miss_count"]) > 0 else 0
-        logger.warning(f"ValidKeyPool miss: pool size {len(self.valid_keys)}, entering emergency refill mode, "
-                      f"miss rate: {miss_rate:.2%}, expired removed: {expired_count}")
+        Returns:
+            Optional[ValidKeyWithTTL]: 可用的备用密钥，没有则返回None
+        """
+        now = time.monotonic()
+        while self._warm_spares:
+            spare = self._warm_spares.popleft()
+            if not spare.is_expired(now) and spare.key not in self.valid_keys:
+                return spare
+            self._restore_refill_candidate(spare.key)
+        return None
+
+    def _stash_warm_spare(self, key_obj: ValidKeyWithTTL) -> None:
+        """
+        将被淘汰的密钥保留为备用密钥，备用期间不作为补充候选，避免被重复验证
 
-        return await self.emergency_refill(model_name)
+        备用列表已满时，挤出的最旧备用密钥重新成为补充候选。
+
+        Args:
+            key_obj: 已从池中注销的密钥对象
+        """
+        spares = self._warm_spares
+        if len(spares) == spares.maxlen:
+            self._restore_refill_candidate(spares.popleft().key)
+        spares.append(key_obj)
+        self._discard_refill_candidate(key_obj.key)
 
     def _trigger_refill_on_key_removal(self, model_name: str = None) -> None:
         """
         当密钥被移出池子时触发补充逻辑
         """
-        min_threshold = int(getattr(settings, 'POOL_MIN_THRESHOLD', 10))
+        min_threshold = self._min_threshold
         current_size = len(self.valid_keys)
 
         if current_size < min_threshold // 2:  # 低于阈值的一半时触发紧急补充
-            logger.warning(f"Pool size {current_size} critically low (< {min_threshold//2}), triggering emergency refill")
-            asyncio.create_task(self._persistent_emergency_refill())
+            logger.warning("Pool size %s critically low (< %s), triggering emergency refill", current_size, min_threshold//2)
+            self._schedule_emergency_refill()
         elif current_size < self.pool_size:  # 未达到最大容量时继续补充
-            # 循序式补充策略：每次只补充1个密钥
-            import random
-
-            if current_size < min_threshold:
-                # 低于阈值时，高概率补充1个
-                refill_chance = 0.9  # 90%概率补充
-                logger.info(f"Pool size {current_size} below threshold {min_threshold}, triggering sequential refill (90% chance)")
-            elif current_size < self.pool_size * 0.8:  # 低于80%容量时
-                # 根据池大小动态调整补充概率
-                if current_size < min_threshold * 1.5:  # 低于30个时
-                    refill_chance = 0.7  # 70%概率补充
-                elif current_size < min_threshold * 2:  # 低于40个时
-                    refill_chance = 0.5  # 50%概率补充
-                else:  # 40个以上时
-                    refill_chance = 0.3  # 30%概率补充
-                logger.debug(f"Pool size {current_size} below 80% capacity, refill chance: {refill_chance*100:.0f}%")
-            else:
-                # 接近满容量时，低概率补充
-                refill_chance = 0.1  # 10%概率补充
-                logger.debug(f"Pool size {current_size} near capacity, refill chance: {refill_chance*100:.0f}%")
-
-            if random.random() < refill_chance:
-                logger.info(f"Key removed from pool, current size {current_size}, triggering sequential async refill")
+            # 循序式补充策略：每次只补充1个密钥；低于阈值时总是补充，否则由令牌桶限速
+            now = time.monotonic()
+            self._refill_tokens = min(1.0, self._refill_tokens + (now - self._refill_last_monotonic) * self._refill_rate)
+            self._refill_last_monotonic = now
+
+            if current_size < min_threshold or self._refill_tokens >= 1.0:
+                self._refill_tokens = max(0.0, self._refill_tokens - 1.0)
+                logger.info("Key removed from pool, current size %s, triggering sequential async refill", current_size)
                 asyncio.create_task(self.async_verify_and_add(model_name))
             else:
-                logger.debug(f"Key removed from pool, current size {current_size}, skipping refill")
+                logger.debug("Key removed from pool, current size %s, refill rate-limited", current_size)
         else:
-            logger.debug(f"Pool size {current_size} at capacity {self.pool_size}, no refill needed")
+            logger.debug("Pool size %s at capacity %s, no refill needed", current_size, self.pool_size)
 
-    async def async_verify_and_add(self, model_name: str = None) -> None:
+    async def async_verify_and_add(self, model_name: str = None) -> bool:
         """
         异步验证随机密钥并添加到池中
 
         Args:
             model_name: 模型名称，用于确定使用次数限制
+
+        Returns:
+            bool: 有密钥被加入池中返回True，否则返回False
         """
         logger.info("Starting async_verify_and_add")
 
@@ -266,65 +518,45 @@ class ValidKeyPool:
             # 在获取信号量后，再次检查池是否已满
             if len(self.valid_keys) >= self.pool_size:
                 logger.debug("Pool is full, skipping verification")
-                return
-
-            # 获取可能有效的密钥列表（排除已知失效的密钥）
-            available_keys = []
-            total_keys = len(self.key_manager.api_keys)
-            for key in self.key_manager.api_keys:
-                # 检查密钥是否被标记为失效
-                if await self.key_manager.is_key_available_for_verification(key):
-                    available_keys.append(key)
-
-            logger.info(f"Key availability check: {len(available_keys)}/{total_keys} keys are valid")
+                return False
 
-            if not available_keys:
+            # 从不在池中且未在验证中的密钥里随机抽取，只检查抽中密钥的可用性
+            selected_keys = self._select_refill_candidates(1)
+            if not selected_keys:
                 logger.warning("No valid API keys available for verification")
-                return
-
-            # 选择密钥策略：优先选择未在池中的密钥
-            pool_keys = self._pool_keys_set
-            unused_keys = [key for key in available_keys if key not in pool_keys]
-
-            if unused_keys:
-                # 从未使用的密钥中随机选择
-                selected_key = random.choice(unused_keys)
-                logger.info(f"Selected unused key {redact_key_for_logging(selected_key)} from {len(unused_keys)} unused keys")
-            else:
-                # 如果所有密钥都在池中，随机选择一个
-                selected_key = random.choice(available_keys)
-                logger.info(f"All keys in use, selected key {redact_key_for_logging(selected_key)} from {len(available_keys)} available keys")
+                return False
 
-            # 检查密钥是否已在池中
-            if self._is_key_in_pool(selected_key):
-                logger.info(f"Key {redact_key_for_logging(selected_key)} already in pool, skipping")
-                return
+            selected_key = selected_keys[0]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Selected unused key %s from %s candidate keys", redact_key_for_logging(selected_key), len(self._refill_candidates))
 
-            # 验证密钥
-            verification_start = time.time()
+            # 验证密钥（若其他任务正在验证同一密钥，则等待其结果而不重复请求）
+            verification_start = time.monotonic()
             if await self._verify_key(selected_key):
-                # 验证成功后，再次检查池大小（防止竞态条件）
-                if len(self.valid_keys) >= self.pool_size:
-                    logger.warning(f"Pool size limit reached ({self.pool_size}) after verification, skipping add for key {redact_key_for_logging(selected_key)}")
-                    return
-
                 # 添加到池中（使用默认的无限制，具体限制在获取时根据模型类型判断）
-                verification_time = time.time() - verification_start
+                # 池已满时只有比最早过期的密钥更新鲜才会替换它（防止竞态条件）
+                if not self.append_key(ValidKeyWithTTL(selected_key, self.ttl_hours)):
+                    logger.warning("Pool size limit reached (%s) after verification, skipping add for key %s", self.pool_size, redact_key_for_logging(selected_key))
+                    return False
+
+                verification_time = time.monotonic() - verification_start
                 self._update_avg_verification_time(verification_time)
 
-                key_obj = ValidKeyWithTTL(selected_key, self.ttl_hours)
-                self.valid_keys.append(key_obj)
-                self._pool_keys_set.add(key_obj.key)
-                self.stats["successful_verifications"] += 1
+                self._successful_verifications += 1
 
                 # 记录详细的验证成功日志
-                pool_utilization = len(self.valid_keys) / self.pool_size if self.pool_size > 0 else 0
-                logger.info(f"Successfully verified and added key {redact_key_for_logging(selected_key)} to pool, "
-                           f"verification time: {verification_time:.3f}s, pool utilization: {pool_utilization:.1%}")
+                if logger.isEnabledFor(logging.INFO):
+                    pool_utilization = len(self.valid_keys) / self.pool_size if self.pool_size > 0 else 0
+                    logger.info("Successfully verified and added key %s to pool, "
+                               "verification time: %.3fs, pool utilization: %.1f%%",
+                               redact_key_for_logging(selected_key), verification_time, pool_utilization * 100)
+                return True
             else:
-                self.stats["verification_failures"] += 1
-                logger.debug(f"Key verification failed for {redact_key_for_logging(selected_key)}")
-    
+                self._verification_failures += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Key verification failed for %s", redact_key_for_logging(selected_key))
+            return False
+
     async def emergency_refill(self, model_name: str = None) -> str:
         """
         紧急恢复模式：立即返回一个候选密钥，并在后台异步验证和补充池。
@@ -332,18 +564,31 @@ class ValidKeyPool:
         logger.warning("Starting non-blocking emergency refill process")
 
         # 尝试立即获取一个候选密钥返回，避免阻塞请求
-        candidate_key = await self.key_manager.get_next_working_key(model_name)
-        logger.info(f"Immediately returning candidate key {redact_key_for_logging(candidate_key)} for the current request.")
+        # 直接走密钥列表轮询：get_next_working_key 会重新进入本池，在池为空时无限递归
+        candidate_key = await self.key_manager._original_get_next_working_key(model_name)
+        logger.info("Immediately returning candidate key %s for the current request.", redact_key_for_logging(candidate_key))
 
-        # 检查紧急补充锁，如果未锁定，则创建后台任务
-        if not self.emergency_lock.locked():
-            logger.info("Emergency lock is not locked, creating background refill task.")
-            asyncio.create_task(self._persistent_emergency_refill())
+        # 同一时刻只保留一个后台补充任务，并发的未命中共享同一次补充
+        if self._schedule_emergency_refill():
+            logger.info("Created background emergency refill task.")
         else:
             logger.info("Emergency refill task is already running in the background.")
 
         return candidate_key
 
+    def _schedule_emergency_refill(self) -> bool:
+        """
+        以单飞方式启动后台紧急补充任务：已有任务在途（包括已创建但尚未开始运行）时不再创建
+
+        Returns:
+            bool: 新建了补充任务返回True，已有任务在途返回False
+        """
+        task = self._emergency_refill_task
+        if (task is not None and not task.done()) or self.emergency_lock.locked():
+            return False
+        self._emergency_refill_task = asyncio.create_task(self._persistent_emergency_refill())
+        return True
+
     async def _persistent_emergency_refill(self) -> None:
         """
         持续的异步紧急补充守护任务。
@@ -355,52 +600,57 @@ class ValidKeyPool:
             return
 
         async with self.emergency_lock:
-            logger.info("Starting persistent emergency refill task.")
-            self.stats["emergency_refill_count"] += 1
             min_threshold = int(getattr(settings, 'POOL_MIN_THRESHOLD', 10))
 
+            # 先清理过期密钥，避免其占位导致池大小被高估
+            self._remove_expired_keys()
+
+            # 池已由上一次补充恢复到阈值以上时无需补充，也不计入紧急补充次数
+            if len(self.valid_keys) >= min_threshold:
+                logger.debug("Pool size %s already at threshold %s, skipping emergency refill.", len(self.valid_keys), min_threshold)
+                return
+
+            logger.info("Starting persistent emergency refill task.")
+            self._emergency_refill_count += 1
+
             while len(self.valid_keys) < min_threshold:
                 try:
                     current_size = len(self.valid_keys)
                     needed = min_threshold - current_size
-                    logger.info(f"Refill cycle started: current size {current_size}, threshold {min_threshold}, need {needed}.")
+                    logger.info("Refill cycle started: current size %s, threshold %s, need %s.", current_size, min_threshold, needed)
 
                     # 并发验证多个密钥
                     refill_count = min(int(settings.EMERGENCY_REFILL_COUNT), needed)
 
-                    # 获取可能有效的密钥列表
-                    available_keys = [
-                        key for key in self.key_manager.api_keys
-                        if await self.key_manager.is_key_available_for_verification(key) and not self._is_key_in_pool(key)
-                    ]
+                    # 先抽样再批量检查可用性，避免对全部密钥逐个检查
+                    selected_keys = self._select_refill_candidates(refill_count)
 
-                    if not available_keys:
+                    if not selected_keys:
                         logger.warning("No valid API keys available for refill cycle. Waiting...")
                         await asyncio.sleep(15)
                         continue
 
-                    selected_keys = random.sample(available_keys, min(refill_count, len(available_keys)))
-                    logger.info(f"Refill cycle: selected {len(selected_keys)} keys for verification.")
-
-                    # 并发验证
-                    tasks = [self._verify_key_for_emergency(key) for key in selected_keys]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    logger.info("Refill cycle: selected %s keys for verification.", len(selected_keys))
 
-                    # 处理结果
+                    # 并发验证，结果按完成顺序立即入池
+                    tasks = [asyncio.create_task(self._verify_key_for_emergency(key)) for key in selected_keys]
                     success_count = 0
-                    for result in results:
-                        if isinstance(result, str):  # 验证成功返回密钥
-                            if len(self.valid_keys) >= self.pool_size:
-                                logger.warning(f"Pool size limit reached ({self.pool_size}), stopping this refill cycle.")
-                                break
-                            
-                            if not self._is_key_in_pool(result):
-                                key_obj = ValidKeyWithTTL(result, self.ttl_hours)
-                                self.valid_keys.append(key_obj)
-                                self._pool_keys_set.add(key_obj.key)
+                    try:
+                        for next_result in asyncio.as_completed(tasks):
+                            result = await next_result
+                            if result is None:  # 验证失败
+                                continue
+
+                            if self.append_key(ValidKeyWithTTL(result, self.ttl_hours)):
                                 success_count += 1
+                    finally:
+                        pending = [task for task in tasks if not task.done()]
+                        for task in pending:
+                            task.cancel()
+                        if pending:
+                            await asyncio.gather(*pending, return_exceptions=True)
 
-                    logger.info(f"Refill cycle completed: added {success_count} keys, pool size now: {len(self.valid_keys)}.")
+                    logger.info("Refill cycle completed: added %s keys, pool size now: %s.", success_count, len(self.valid_keys))
 
                     # 如果没有成功添加任何密钥，并且池仍然需要补充，则等待
                     if success_count == 0 and len(self.valid_keys) < min_threshold:
@@ -408,10 +658,45 @@ class ValidKeyPool:
                         await asyncio.sleep(15)
 
                 except Exception as e:
-                    logger.error(f"An error occurred during persistent refill cycle: {e}", exc_info=True)
+                    logger.error("An error occurred during persistent refill cycle: %s", e, exc_info=True)
                     await asyncio.sleep(15)  # 发生异常后也等待
 
-            logger.info(f"Persistent emergency refill task finished. Pool size {len(self.valid_keys)} has reached threshold {min_threshold}.")
+            logger.info("Persistent emergency refill task finished. Pool size %s has reached threshold %s.", len(self.valid_keys), min_threshold)
+
+    def _select_refill_candidates(self, refill_count: int) -> list:
+        """
+        为紧急补充选择候选密钥
+
+        先从不在池中的候选密钥里随机抽取 refill_count * 3 个（跳过正在验证的密钥），
+        再同步批量检查可用性；只有抽样结果不足时才回退到剩余候选密钥，洗牌后逐段检查直到凑够数量。
+
+        Args:
+            refill_count: 需要的候选密钥数量
+
+        Returns:
+            list: 最多 refill_count 个可用于验证的候选密钥
+        """
+        in_flight = self._verification_futures
+        candidates = self._refill_candidates
+        if not candidates or refill_count <= 0:
+            return []
+
+        sample_size = min(refill_count * 3, len(candidates))
+        sampled = random.sample(candidates, sample_size)
+        available = self.key_manager.filter_keys_available_for_verification([key for key in sampled if key not in in_flight])
+
+        if len(available) < refill_count and sample_size < len(candidates):
+            # 抽样中的可用密钥不足，回退到剩余候选：洗牌一次后按段检查，凑够数量即停止
+            sampled_set = set(sampled)
+            remaining = [key for key in candidates if key not in sampled_set and key not in in_flight]
+            random.shuffle(remaining)
+            step = refill_count * 3
+            for start in range(0, len(remaining), step):
+                available.extend(self.key_manager.filter_keys_available_for_verification(remaining[start:start + step]))
+                if len(available) >= refill_count:
+                    break
+
+        return available[:refill_count]
 
     async def _validate_pool_keys(self) -> None:
         """
@@ -421,58 +706,74 @@ class ValidKeyPool:
             logger.debug("Pool is empty, skipping validation")
             return
 
-        logger.info(f"Starting pool validation for {len(self.valid_keys)} keys")
+        logger.info("Starting pool validation for %s keys", len(self.valid_keys))
 
         # 随机选择最多5个密钥进行验证（避免验证过多影响性能）
-        keys_to_validate = list(self.valid_keys)
-        if len(keys_to_validate) > 5:
-            import random
-            keys_to_validate = random.sample(keys_to_validate, 5)
-
-        removed_count = 0
-        for key_obj in keys_to_validate:
+        # 先抽取位置再单次遍历取出，无需复制整个队列
+        pool_len = len(self.valid_keys)
+        if pool_len > 5:
+            picked = set(random.sample(range(pool_len), 5))
+            keys_to_validate = [key_obj for index, key_obj in enumerate(self.valid_keys.values()) if index in picked]
+        else:
+            keys_to_validate = list(self.valid_keys.values())
+
+        now = time.monotonic()
+        grace_period_seconds = settings.KEY_VALIDATION_GRACE_PERIOD_MINUTES * 60
+        # 验证期间会await，先快照所需字段，判断基于开始验证时的状态
+        snapshots = [(key_obj.key, key_obj, key_obj.created_at_monotonic, key_obj.expires_at_monotonic) for key_obj in keys_to_validate]
+        removed = []
+        for key, key_obj, created_at_monotonic, expires_at_monotonic in snapshots:
             try:
                 # 检查密钥是否已过宽限期
-                grace_period_minutes = 5
-                if datetime.now() - key_obj.created_at < timedelta(minutes=grace_period_minutes):
-                    logger.debug(f"Key {redact_key_for_logging(key_obj.key)} is within the grace period, skipping validation.")
-                    continue
-
-                # 检查密钥是否已过宽限期
-                grace_period_minutes = settings.KEY_VALIDATION_GRACE_PERIOD_MINUTES
-                if datetime.now() - key_obj.created_at < timedelta(minutes=grace_period_minutes):
-                    logger.debug(f"Key {redact_key_for_logging(key_obj.key)} is within the grace period, skipping validation.")
+                if now - created_at_monotonic < grace_period_seconds:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Key %s is within the grace period, skipping validation.", redact_key_for_logging(key))
                     continue
 
                 # 检查密钥是否过期
-                if key_obj.is_expired():
-                    # This is slow, but keys_to_validate is small.
-                    self.valid_keys.remove(key_obj)
-                    self._pool_keys_set.discard(key_obj.key)
-                    removed_count += 1
-                    logger.debug(f"Removed expired key {redact_key_for_logging(key_obj.key)}")
+                if now > expires_at_monotonic:
+                    removed.append((key, key_obj))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Removed expired key %s", redact_key_for_logging(key))
                     continue
 
                 # 验证密钥是否仍然有效
-                is_valid = await self._verify_key(key_obj.key)
+                is_valid = await self._verify_key(key)
                 if not is_valid:
-                    # This is slow, but keys_to_validate is small.
-                    self.valid_keys.remove(key_obj)
-                    self._pool_keys_set.discard(key_obj.key)
-                    removed_count += 1
-                    logger.info(f"Removed invalid key {redact_key_for_logging(key_obj.key)} from pool")
+                    removed.append((key, key_obj))
+                    logger.info("Removed invalid key %s from pool", redact_key_for_logging(key))
 
             except Exception as e:
-                logger.warning(f"Error validating key {redact_key_for_logging(key_obj.key)}: {e}")
+                logger.warning("Error validating key %s: %s", redact_key_for_logging(key), e)
+
+        # 按键直接删除；验证期间密钥可能已被移出或替换，只删除仍是同一对象的条目
+        removed_count = 0
+        for key, key_obj in removed:
+            if self.valid_keys.get(key) is key_obj:
+                del self.valid_keys[key]
+                self._untrack_key(key_obj)
+                removed_count += 1
 
         if removed_count > 0:
-            logger.info(f"Pool validation completed: removed {removed_count} invalid keys, pool size: {len(self.valid_keys)}")
+            logger.info("Pool validation completed: removed %s invalid keys, pool size: %s", removed_count, len(self.valid_keys))
         else:
-            logger.debug(f"Pool validation completed: all validated keys are valid, pool size: {len(self.valid_keys)}")
+            logger.debug("Pool validation completed: all validated keys are valid, pool size: %d", len(self.valid_keys))
 
     async def _verify_key(self, key: str) -> bool:
         """
-        验证单个密钥
+        验证单个密钥，与同一密钥正在进行的验证合并
+
+        Args:
+            key: 要验证的密钥
+
+        Returns:
+            bool: 验证是否成功
+        """
+        return await self._coalesce_verification(key, self._run_key_verification)
+
+    async def _run_key_verification(self, key: str) -> bool:
+        """
+        向API发送验证请求并处理结果
         
         Args:
             key: 要验证的密钥
@@ -480,7 +781,7 @@ class ValidKeyPool:
         Returns:
             bool: 验证是否成功
         """
-        self.stats["total_verifications"] += 1
+        self._total_verifications += 1
         
         try:
             if not self.chat_service:
@@ -504,15 +805,15 @@ class ValidKeyPool:
             
             # 验证成功，重置失败计数
             await self.key_manager.reset_key_failure_count(key)
-            logger.debug(f"Key verification successful for {redact_key_for_logging(key)}")
+            logger.debug("Key verification successful for %s", redact_key_for_logging(key))
             return True
             
         except asyncio.CancelledError:
             # 任务被取消，不记录为验证失败
-            logger.debug(f"Key verification cancelled for {redact_key_for_logging(key)}")
+            logger.debug("Key verification cancelled for %s", redact_key_for_logging(key))
             raise  # 重新抛出CancelledError
         except Exception as e:
-            logger.debug(f"Key verification failed for {redact_key_for_logging(key)}: {str(e)}")
+            logger.debug("Key verification failed for %s: %s", redact_key_for_logging(key), e)
 
             # 调用通用错误处理器
             await handle_api_error_and_get_next_key(
@@ -527,13 +828,27 @@ class ValidKeyPool:
     
     async def _verify_key_for_emergency(self, key: str) -> Optional[str]:
         """
-        紧急恢复模式的密钥验证（简化版，避免递归调用）
+        紧急恢复模式的密钥验证，与同一密钥正在进行的验证合并
+
+        Args:
+            key: 要验证的密钥
+
+        Returns:
+            Optional[str]: 验证成功返回密钥，失败返回None；除取消外不向调用方抛出异常
+        """
+        if await self._coalesce_verification(key, self._run_emergency_verification):
+            return key
+        return None
+
+    async def _run_emergency_verification(self, key: str) -> Optional[str]:
+        """
+        紧急恢复模式的密钥验证请求（简化版，避免递归调用）
 
         Args:
             key: 要验证的密钥
 
         Returns:
-            Optional[str]: 验证成功返回密钥，失败返回None
+            Optional[str]: 验证成功返回密钥，失败返回None；除取消外不向调用方抛出异常
         """
         try:
             if not self.chat_service:
@@ -551,30 +866,35 @@ class ValidKeyPool:
             )
 
             # 发送验证请求（不调用错误处理器，避免递归）
-            await self.chat_service.generate_content(
-                settings.TEST_MODEL, gemini_request, key
-            )
+            # 信号量按单个请求获取，限制的是同时进行的验证数量而不是批次数量
+            async with self.verification_semaphore:
+                await self.chat_service.generate_content(
+                    settings.TEST_MODEL, gemini_request, key
+                )
 
             # 验证成功，重置失败计数
             await self.key_manager.reset_key_failure_count(key)
-            logger.debug(f"Emergency key verification successful for {redact_key_for_logging(key)}")
+            logger.debug("Emergency key verification successful for %s", redact_key_for_logging(key))
             return key
 
         except asyncio.CancelledError:
             # 任务被取消
-            logger.debug(f"Emergency key verification cancelled for {redact_key_for_logging(key)}")
+            logger.debug("Emergency key verification cancelled for %s", redact_key_for_logging(key))
             raise
         except Exception as e:
             # 调用通用错误处理器来记录日志和处理密钥状态
-            logger.debug(f"Emergency key verification failed for {redact_key_for_logging(key)}: {str(e)}")
-            await handle_api_error_and_get_next_key(
-                key_manager=self.key_manager,
-                error=e,
-                old_key=key,
-                model_name=settings.TEST_MODEL,
-                retries=self.key_manager.MAX_FAILURES,  # 传递高重试次数以确保必要时标记为失败
-                source="key_validation",
-            )
+            logger.debug("Emergency key verification failed for %s: %s", redact_key_for_logging(key), e)
+            try:
+                await handle_api_error_and_get_next_key(
+                    key_manager=self.key_manager,
+                    error=e,
+                    old_key=key,
+                    model_name=settings.TEST_MODEL,
+                    retries=self.key_manager.MAX_FAILURES,  # 传递高重试次数以确保必要时标记为失败
+                    source="key_validation",
+                )
+            except Exception as handler_error:
+                logger.warning("Error handling failed emergency verification for %s: %s", redact_key_for_logging(key), handler_error)
             return None
 
     def _remove_expired_keys(self) -> int:
@@ -582,37 +902,34 @@ class ValidKeyPool:
         处理池中的过期密钥。
         对于过期的密钥，不再直接移除，而是触发一个后台任务对其进行重新验证。
         """
-        expired_count = 0
-        keys_to_keep = deque()
+        now = time.monotonic()
+        # 最早的过期时间都未到时池内没有过期密钥，无需遍历
+        if not self._expires_sorted or self._expires_sorted[0] >= now:
+            return 0
+
+        valid_keys = self.valid_keys
+        # 过期时间有序索引给出过期密钥的确切数量，收集齐后即停止遍历；
+        # 先收集再按键删除，保留的密钥顺序不变
+        expired_total = bisect_left(self._expires_sorted, now)
         keys_to_revalidate = []
-
-        # 遍历当前池，分离出未过期的和已过期的
-        while self.valid_keys:
-            key_obj = self.valid_keys.popleft()
-            # The key is always removed from the set here.
-            # If it's not expired, it will be added back to both deque and set.
-            self._pool_keys_set.discard(key_obj.key)
-            if not key_obj.is_expired():
-                keys_to_keep.append(key_obj)
-            else:
-                expired_count += 1
-                keys_to_revalidate.append(key_obj.key)
-        
-        # 将未过期的密钥放回池中
-        self.valid_keys = keys_to_keep
-        # Re-add the keys that were kept to the set
-        for key_obj in self.valid_keys:
-            self._pool_keys_set.add(key_obj.key)
+        for key, key_obj in valid_keys.items():
+            if key_obj.expires_at_monotonic < now:
+                keys_to_revalidate.append(key)
+                if len(keys_to_revalidate) >= expired_total:
+                    break
+        for key in keys_to_revalidate:
+            self._untrack_key(valid_keys.pop(key))
+        expired_count = len(keys_to_revalidate)
 
         # 为所有过期的密钥创建后台重新验证任务
         if keys_to_revalidate:
-            logger.info(f"Found {len(keys_to_revalidate)} expired keys. Triggering async re-validation for them.")
+            logger.info("Found %s expired keys. Triggering async re-validation for them.", len(keys_to_revalidate))
             for key in keys_to_revalidate:
                 asyncio.create_task(self._revalidate_and_readd_key(key))
         
         if expired_count > 0:
-            self.stats["expired_keys_removed"] += expired_count
-            logger.info(f"Processed {expired_count} expired keys. They will be re-validated in the background.")
+            self._expired_keys_removed += expired_count
+            logger.info("Processed %s expired keys. They will be re-validated in the background.", expired_count)
 
         return expired_count
 
@@ -624,47 +941,235 @@ class ValidKeyPool:
         async with self.verification_semaphore:
             # 在开始验证前，再次检查池是否已满或密钥是否已通过其他方式被加回
             if len(self.valid_keys) >= self.pool_size:
-                logger.debug(f"Pool is full, skipping re-validation for expired key: {redact_key_for_logging(key)}")
+                logger.debug("Pool is full, skipping re-validation for expired key: %s", redact_key_for_logging(key))
                 return
-            if self._is_key_in_pool(key):
-                logger.debug(f"Key {redact_key_for_logging(key)} is already back in the pool, skipping re-validation.")
+            if key in self.valid_keys:
+                logger.debug("Key %s is already back in the pool, skipping re-validation.", redact_key_for_logging(key))
+                return
+            if key in self._verification_futures:
+                logger.debug("Key %s is already being verified, skipping re-validation.", redact_key_for_logging(key))
                 return
 
-            logger.info(f"Background re-validating expired key: {redact_key_for_logging(key)}")
+            logger.info("Background re-validating expired key: %s", redact_key_for_logging(key))
             if await self._verify_key(key):
                 # 如果验证成功，创建一个新的带有刷新后TTL的密钥对象
                 new_key_obj = ValidKeyWithTTL(key, self.ttl_hours)
                 # 再次检查池是否已满（以防在验证过程中池被填满）
-                if len(self.valid_keys) < self.pool_size:
-                    self.valid_keys.append(new_key_obj)
-                    self._pool_keys_set.add(new_key_obj.key)
-                    logger.info(f"Successfully re-validated and re-added key {redact_key_for_logging(key)} to the pool. "
-                               f"New pool size: {len(self.valid_keys)}")
+                if self.append_key(new_key_obj):
+                    logger.info("Successfully re-validated and re-added key %s to the pool. "
+                               "New pool size: %s",
+                               redact_key_for_logging(key), len(self.valid_keys))
                 else:
-                    logger.warning(f"Pool became full during re-validation. Discarding re-validated key: {redact_key_for_logging(key)}")
+                    logger.warning("Pool became full during re-validation. Discarding re-validated key: %s", redact_key_for_logging(key))
             else:
                 # _verify_key 内部已经处理了失败标记，这里只需记录日志
-                logger.info(f"Re-validation failed for key {redact_key_for_logging(key)}. It will not be re-added.")
+                logger.info("Re-validation failed for key %s. It will not be re-added.", redact_key_for_logging(key))
+
+    async def _coalesce_verification(self, key: str, verify) -> bool:
+        """
+        合并同一密钥的并发验证
+
+        第一个调用方执行实际验证；验证进行期间的其他调用方等待同一个 future，
+        不再重复请求API。查找与登记之间没有await，在事件循环中是原子的，无需额外加锁。
+
+        Args:
+            key: 要验证的密钥
+            verify: 实际执行验证的协程函数，返回值按真假判断结果
+
+        Returns:
+            bool: 验证是否成功；执行方异常时等待方收到同一异常，
+            执行方被取消时密钥并未完成验证，等待方重新发起验证
+        """
+        while True:
+            pending = self._verification_futures.get(key)
+            if pending is None:
+                break
+            try:
+                # shield: 等待方被取消时不影响共享的 future
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    # 等待方自身被取消
+                    raise
+                # 执行方被取消，重新检查：已有其他等待方接手则继续等待，否则由本调用方验证
+
+        future = asyncio.get_running_loop().create_future()
+        self._verification_futures[key] = future
+        try:
+            result = bool(await verify(key))
+        except asyncio.CancelledError:
+            # 例如预加载达到目标后取消剩余任务：不能把未验证的密钥当作验证失败通知等待方
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 执行方会自行抛出该异常；标记为已读取，避免没有等待方时事件循环报告异常未被读取
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._verification_futures[key]
+
+    def _track_key(self, key_obj: ValidKeyWithTTL) -> None:
+        """
+        登记新入池的密钥：更新补充候选集合、创建时间聚合和过期时间索引
+
+        Args:
+            key_obj: 已放入 valid_keys 的密钥对象
+        """
+        self._discard_refill_candidate(key_obj.key)
+        self._sum_created += key_obj.created_at_monotonic
+        insort(self._created_sorted, key_obj.created_at_monotonic)
+        insort(self._expires_sorted, key_obj.expires_at_monotonic)
+        self._stats_cache.remove("stats")
+
+    def _untrack_key(self, key_obj: ValidKeyWithTTL) -> None:
+        """
+        注销已移出池的密钥：更新补充候选集合、创建时间聚合和过期时间索引
+
+        Args:
+            key_obj: 已从 valid_keys 移除的密钥对象
+        """
+        if key_obj.key in self.key_manager.key_failure_counts:
+            # 仍由 KeyManager 管理的密钥重新成为补充候选
+            self._add_refill_candidate(key_obj.key)
+        index = bisect_left(self._created_sorted, key_obj.created_at_monotonic)
+        if index < len(self._created_sorted) and self._created_sorted[index] == key_obj.created_at_monotonic:
+            del self._created_sorted[index]
+            self._sum_created -= key_obj.created_at_monotonic
+        index = bisect_left(self._expires_sorted, key_obj.expires_at_monotonic)
+        if index < len(self._expires_sorted) and self._expires_sorted[index] == key_obj.expires_at_monotonic:
+            del self._expires_sorted[index]
+        if not self._created_sorted:
+            # 池为空时清零，避免浮点累加误差
+            self._sum_created = 0.0
+        self._stats_cache.remove("stats")
+
+    def _restore_refill_candidate(self, key: str) -> None:
+        """
+        离开备用列表的密钥若不在池中且仍由 KeyManager 管理，重新成为补充候选
+
+        Args:
+            key: 离开备用列表的密钥
+        """
+        if key not in self.valid_keys and key in self.key_manager.key_failure_counts:
+            self._add_refill_candidate(key)
+
+    def _add_refill_candidate(self, key: str) -> None:
+        """
+        将密钥加入补充候选集合
+
+        Args:
+            key: 不在池中的密钥
+        """
+        if key not in self._refill_candidate_index:
+            self._refill_candidate_index[key] = len(self._refill_candidates)
+            self._refill_candidates.append(key)
+
+    def _discard_refill_candidate(self, key: str) -> None:
+        """
+        从补充候选集合中移除密钥（与末尾元素交换后弹出）
 
-    def _is_key_in_pool(self, key: str) -> bool:
+        Args:
+            key: 要移除的密钥
+        """
+        index = self._refill_candidate_index.pop(key, None)
+        if index is None:
+            return
+        last_key = self._refill_candidates.pop()
+        if last_key != key:
+            self._refill_candidates[index] = last_key
+            self._refill_candidate_index[last_key] = index
+
+    def _reset_refill_candidates(self) -> None:
+        """按 KeyManager 当前的密钥列表重建补充候选集合，跳过池中密钥和备用密钥"""
+        self._refill_candidates.clear()
+        self._refill_candidate_index.clear()
+        pool_keys = self.valid_keys
+        spare_keys = {spare.key for spare in self._warm_spares}
+        for key in self.key_manager.api_keys:
+            if key not in pool_keys and key not in spare_keys:
+                self._add_refill_candidate(key)
+
+    def append_key(self, key_obj: ValidKeyWithTTL) -> bool:
+        """
+        将密钥对象加入池尾
+
+        池已满时，仅当新密钥比池中最早过期的密钥过期得更晚时，
+        淘汰该最早过期的密钥为新密钥腾出位置。
+
+        Args:
+            key_obj: 要加入的密钥对象
+
+        Returns:
+            bool: 成功加入返回True；池已满且新密钥不更新鲜，或密钥已在池中返回False
+        """
+        if key_obj.key in self.valid_keys:
+            return False
+        if len(self.valid_keys) >= self.pool_size and not self._evict_soonest_expiring(key_obj.expires_at_monotonic):
+            return False
+        self.valid_keys[key_obj.key] = key_obj
+        self._track_key(key_obj)
+        return True
+
+    def _evict_soonest_expiring(self, newcomer_expires_at: float) -> bool:
+        """
+        淘汰池中最早过期的密钥
+
+        Args:
+            newcomer_expires_at: 待加入密钥的过期时间戳
+
+        Returns:
+            bool: 淘汰成功返回True；池为空或新密钥并不比最早过期的密钥更晚过期时返回False
         """
-        检查密钥是否已在池中
+        expires_sorted = self._expires_sorted
+        if not expires_sorted or newcomer_expires_at <= expires_sorted[0]:
+            return False
+        soonest = expires_sorted[0]
+        for key, key_obj in self.valid_keys.items():
+            if key_obj.expires_at_monotonic == soonest:
+                del self.valid_keys[key]
+                self._untrack_key(key_obj)
+                self._ttl_evictions += 1
+                logger.debug("Evicted soonest-expiring key %s to admit a fresher key", redact_key_for_logging(key_obj.key))
+                # 被淘汰的密钥仍然有效，保留为备用密钥而不是直接丢弃
+                self._stash_warm_spare(key_obj)
+                return True
+        return False
+
+    def remove_key(self, key: str) -> bool:
+        """
+        从池中移除指定密钥
 
         Args:
-            key: 要检查的密钥
+            key: 要移除的密钥
 
         Returns:
-            bool: 密钥是否在池中
+            bool: 密钥在池中并被移除返回True，否则返回False
         """
-        return key in self._pool_keys_set
+        if self._warm_spares:
+            spares = self._warm_spares
+            self._warm_spares = deque((spare for spare in spares if spare.key != key), maxlen=spares.maxlen)
+            if len(self._warm_spares) != len(spares):
+                self._restore_refill_candidate(key)
+        if key not in self.key_manager.key_failure_counts:
+            # 密钥已从 KeyManager 删除，不再作为补充候选
+            self._discard_refill_candidate(key)
+        key_obj = self.valid_keys.pop(key, None)
+        if key_obj is None:
+            return False
+        self._untrack_key(key_obj)
+        return True
 
     async def maintenance(self) -> None:
         """
         池维护操作：清理过期密钥，检查池大小，主动补充
         """
-        maintenance_start = time.time()
-        self.stats["maintenance_count"] += 1
-        self.performance_stats["last_maintenance_time"] = datetime.now()
+        maintenance_start = time.monotonic()
+        self._maintenance_count += 1
+        self._last_maintenance_monotonic = maintenance_start
 
         logger.info("Starting pool maintenance")
 
@@ -675,7 +1180,7 @@ class ValidKeyPool:
         current_size = len(self.valid_keys)
         min_threshold = int(getattr(settings, 'POOL_MIN_THRESHOLD', 10))
 
-        logger.info(f"Pool maintenance check: current_size={current_size}, min_threshold={min_threshold}, pool_size={self.pool_size}")
+        logger.info("Pool maintenance check: current_size=%s, min_threshold=%s, pool_size=%s", current_size, min_threshold, self.pool_size)
 
         refilled_count = 0
         # 检查是否需要补充（未达到最大容量）
@@ -691,45 +1196,56 @@ class ValidKeyPool:
                 # 接近满容量时，只补充1-2个密钥
                 refill_target = min(2, self.pool_size - current_size)
 
-            logger.info(f"Pool maintenance: current {current_size}/{self.pool_size}, will add {refill_target} keys (sequential)")
-
-            refill_attempt = 0
-            max_refill_attempts = refill_target * 3  # 允许一些失败重试
-
-            while refilled_count < refill_target and refill_attempt < max_refill_attempts:
-                try:
-                    before_size = len(self.valid_keys)
-                    await self.async_verify_and_add()
-                    after_size = len(self.valid_keys)
-
-                    if after_size > before_size:
-                        refilled_count += 1
-                        logger.info(f"Maintenance refilled {refilled_count}/{refill_target} keys, pool size: {after_size}/{self.pool_size}")
-
-                    refill_attempt += 1
-                    # 增加延迟，避免过于频繁的验证
-                    await asyncio.sleep(0.5)  # 从0.1秒增加到0.5秒
-
-                except asyncio.CancelledError:
-                    logger.info(f"Pool maintenance cancelled during refill attempt {refill_attempt}")
-                    break  # 停止补充但继续完成维护
-                except Exception as e:
-                    logger.warning(f"Failed to refill key attempt {refill_attempt}: {e}")
-                    refill_attempt += 1
+            logger.info("Pool maintenance: current %s/%s, will add %s keys (concurrent)", current_size, self.pool_size, refill_target)
+
+            # 生产者/消费者：队列中放入允许的补充尝试次数（允许一些失败重试），
+            # 由多个worker并发消费，并发度由验证信号量限制，无需额外延迟
+            attempts: asyncio.Queue = asyncio.Queue()
+            for _ in range(refill_target * 3):
+                attempts.put_nowait(None)
+
+            in_progress = 0
+
+            async def refill_worker() -> None:
+                nonlocal refilled_count, in_progress
+                # 已成功数加进行中的尝试数达到目标后不再发起新尝试，避免超额补充
+                while refilled_count + in_progress < refill_target:
+                    try:
+                        attempts.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    in_progress += 1
+                    try:
+                        if await self.async_verify_and_add():
+                            refilled_count += 1
+                            logger.info("Maintenance refilled %s/%s keys, pool size: %s/%s", refilled_count, refill_target, len(self.valid_keys), self.pool_size)
+                    except Exception as e:
+                        logger.warning("Failed to refill key during maintenance: %s", e)
+                    finally:
+                        in_progress -= 1
+                        attempts.task_done()
+
+            worker_count = max(1, min(int(settings.CONCURRENT_VERIFICATIONS), refill_target))
+            try:
+                await asyncio.gather(*(refill_worker() for _ in range(worker_count)))
+            except asyncio.CancelledError:
+                logger.info("Pool maintenance cancelled during refill, %s/%s keys added", refilled_count, refill_target)
+                # 停止补充但继续完成维护
         else:
-            logger.info(f"Pool size ({current_size}) at capacity ({self.pool_size}), no refill needed")
+            logger.info("Pool size (%s) at capacity (%s), no refill needed", current_size, self.pool_size)
 
         # 定期验证池内密钥，清理失效的密钥
         # await self._validate_pool_keys() # 此功能在高并发时可能导致问题，暂时禁用
                     # 继续尝试下一个密钥
 
-        maintenance_time = time.time() - maintenance_start
+        maintenance_time = time.monotonic() - maintenance_start
         final_size = len(self.valid_keys)
         utilization = final_size / self.pool_size if self.pool_size > 0 else 0
 
-        logger.info(f"Pool maintenance completed in {maintenance_time:.3f}s. "
-                   f"Size: {final_size}/{self.pool_size} ({utilization:.1%}), "
-                   f"Expired removed: {expired_count}, Refilled: {refilled_count}")
+        logger.info("Pool maintenance completed in %.3fs. "
+                   "Size: %s/%s (%.1f%%), "
+                   "Expired removed: %s, Refilled: %s",
+                   maintenance_time, final_size, self.pool_size, utilization * 100, expired_count, refilled_count)
 
     def _update_avg_verification_time(self, verification_time: float) -> None:
         """
@@ -738,79 +1254,129 @@ class ValidKeyPool:
         Args:
             verification_time: 本次验证耗时
         """
-        current_avg = self.performance_stats["avg_verification_time"]
-        total_verifications = self.stats["total_verifications"]
-
-        if total_verifications == 0:
-            self.performance_stats["avg_verification_time"] = verification_time
-        else:
-            # 使用移动平均算法
-            self.performance_stats["avg_verification_time"] = (
-                (current_avg * total_verifications + verification_time) / (total_verifications + 1)
-            )
+        # 写入时只做累加，均值在 performance_stats 中按需计算
+        self._verification_samples += 1
+        self._sum_verification_time += verification_time
 
     def get_pool_stats(self) -> Dict[str, Any]:
         """
         获取池统计信息
 
+        只返回当前状态和累计计数器，比率由调用方按需通过 get_pool_rates 计算。
+        结果缓存1秒，密钥入池/出池、清空池或重置统计时立即失效；
+        期间命中等计数器的变化最多延迟1秒体现。
+
+        Returns:
+            Dict[str, Any]: 包含池状态和统计信息的字典（调用方可自由修改的拷贝）
+        """
+        cached = self._stats_cache.get("stats")
+        if cached is None:
+            cached = self._compute_pool_stats()
+            self._stats_cache.put("stats", cached)
+        # 嵌套的统计字典同样拷贝，避免调用方修改污染缓存
+        return {
+            **cached,
+            "stats": dict(cached["stats"]),
+            "performance_stats": dict(cached["performance_stats"]),
+        }
+
+    def _compute_pool_stats(self) -> Dict[str, Any]:
+        """
+        计算池统计信息
+
         Returns:
             Dict[str, Any]: 包含池状态和统计信息的字典
         """
-        current_size = len(self.valid_keys)
+        # 在同一时刻读取两个时钟：单调时钟用于计算年龄，墙上时钟仅作为统计时间戳
+        now_monotonic = time.monotonic()
+        stats_timestamp_ns = time.time_ns()
+
+        if not self._created_sorted:
+            return {
+                **self._empty_stats_template,
+                "stats": self.stats,
+                "performance_stats": self.performance_stats,
+                "stats_timestamp_ns": stats_timestamp_ns,
+            }
+
+        avg_age, min_age, max_age = self._key_age_stats(now_monotonic)
+
+        return {
+            # 基本池信息
+            "pool_size": self.pool_size,
+            "current_size": len(self.valid_keys),
+            "ttl_hours": self.ttl_hours,
+
+            # 密钥年龄统计
+            "avg_key_age_seconds": avg_age,
+            "max_key_age_seconds": max_age,
+            "min_key_age_seconds": min_age,
+
+            # 详细统计
+            "stats": self.stats,
+            "performance_stats": self.performance_stats,
+
+            # 时间戳（纳秒级Unix时间，由调用方按需格式化）
+            "stats_timestamp_ns": stats_timestamp_ns
+        }
+
+    def _key_age_stats(self, now: float) -> Tuple[int, int, int]:
+        """
+        基于增量维护的创建时间聚合计算密钥年龄，无需遍历整个池
+
+        Args:
+            now: 当前单调时钟时间
+
+        Returns:
+            Tuple[int, int, int]: 平均、最小、最大年龄（秒），池为空时均为0
+        """
+        tracked_count = len(self._created_sorted)
+        if not tracked_count:
+            return 0, 0, 0
+        return (int(now - self._sum_created / tracked_count),
+                int(now - self._created_sorted[-1]),
+                int(now - self._created_sorted[0]))
+
+    def get_pool_rates(self) -> Dict[str, float]:
+        """
+        由累计计数器计算池的比率指标
+
+        Returns:
+            Dict[str, float]: 利用率、命中率、理论最高命中率、验证成功率、TTL过期率等
+        """
         hit_rate = 0.0
         miss_rate = 0.0
-        total_requests = self.stats["hit_count"] + self.stats["miss_count"]
-
+        total_requests = self._total_requests
         if total_requests > 0:
-            hit_rate = self.stats["hit_count"] / total_requests
-            miss_rate = self.stats["miss_count"] / total_requests
+            hit_rate = self._hit_count / total_requests
+            miss_rate = self._miss_count / total_requests
 
         verification_success_rate = 0.0
         verification_failure_rate = 0.0
-        if self.stats["total_verifications"] > 0:
-            verification_success_rate = self.stats["successful_verifications"] / self.stats["total_verifications"]
-            verification_failure_rate = self.stats["verification_failures"] / self.stats["total_verifications"]
-
-        # 计算平均密钥年龄和最老密钥年龄
-        avg_age_seconds = 0
-        max_age_seconds = 0
-        min_age_seconds = 0
-        if self.valid_keys:
-            ages = [key_obj.age_seconds() for key_obj in self.valid_keys]
-            avg_age_seconds = sum(ages) / len(ages)
-            max_age_seconds = max(ages)
-            min_age_seconds = min(ages)
+        if self._total_verifications > 0:
+            verification_success_rate = self._successful_verifications / self._total_verifications
+            verification_failure_rate = self._verification_failures / self._total_verifications
 
         # 计算TTL过期率
         ttl_expiry_rate = 0.0
-        if self.stats["expired_keys_removed"] > 0 and total_requests > 0:
-            ttl_expiry_rate = self.stats["expired_keys_removed"] / (self.stats["expired_keys_removed"] + self.stats["hit_count"])
+        if self._expired_keys_removed > 0 and total_requests > 0:
+            ttl_expiry_rate = self._expired_keys_removed / (self._expired_keys_removed + self._hit_count)
 
-        return {
-            # 基本池信息
-            "pool_size": self.pool_size,
-            "current_size": current_size,
-            "utilization": current_size / self.pool_size if self.pool_size > 0 else 0,
-            "ttl_hours": self.ttl_hours,
+        # 按已返回的不同密钥数计算可达到的最高命中率：每个不同密钥至少需要一次未命中
+        served_key_cardinality = float(len(self._served_keys))
+        theoretical_max_hit_rate = 0.0
+        if total_requests > 0:
+            theoretical_max_hit_rate = max(0.0, (total_requests - served_key_cardinality) / total_requests)
 
-            # 性能指标
+        return {
+            "utilization": len(self.valid_keys) / self.pool_size if self.pool_size > 0 else 0,
             "hit_rate": hit_rate,
             "miss_rate": miss_rate,
+            "served_key_cardinality": served_key_cardinality,
+            "theoretical_max_hit_rate": theoretical_max_hit_rate,
             "verification_success_rate": verification_success_rate,
             "verification_failure_rate": verification_failure_rate,
             "ttl_expiry_rate": ttl_expiry_rate,
-
-            # 密钥年龄统计
-            "avg_key_age_seconds": int(avg_age_seconds),
-            "max_key_age_seconds": int(max_age_seconds),
-            "min_key_age_seconds": int(min_age_seconds),
-
-            # 详细统计
-            "stats": self.stats.copy(),
-            "performance_stats": self.performance_stats.copy(),
-
-            # 时间戳
-            "stats_timestamp": datetime.now().isoformat()
         }
 
     def clear_pool(self) -> int:
@@ -822,8 +1388,13 @@ class ValidKeyPool:
         """
         cleared_count = len(self.valid_keys)
         self.valid_keys.clear()
-        self._pool_keys_set.clear()
-        logger.info(f"Cleared {cleared_count} keys from pool")
+        self._stats_cache.remove("stats")
+        self._warm_spares.clear()
+        self._sum_created = 0.0
+        self._created_sorted.clear()
+        self._expires_sorted.clear()
+        self._reset_refill_candidates()
+        logger.info("Cleared %s keys from pool", cleared_count)
         return cleared_count
 
     async def preload_pool(self, target_size: Optional[int] = None) -> int:
@@ -839,87 +1410,99 @@ class ValidKeyPool:
         if target_size is None:
             target_size = max(1, self.pool_size // 2)
 
-        logger.info(f"Starting pool preload, target size: {target_size}")
-
-        # 使用信号量控制并发验证
-        async with self.verification_semaphore:
-            # 使用并发验证提高预加载效率
-            batch_size = min(10, target_size)  # 每批验证10个
-            total_loaded = 0
-
-            while len(self.valid_keys) < target_size and total_loaded < target_size * 2:
-                # 获取可用密钥
-                available_keys = []
-                for key in self.key_manager.api_keys:
-                    if await self.key_manager.is_key_available_for_verification(key) and not self._is_key_in_pool(key):
-                        available_keys.append(key)
-
-                if not available_keys:
-                    logger.warning("No more valid keys available for preload")
-                    break
+        logger.info("Starting pool preload, target size: %s", target_size)
 
-                # 选择一批密钥进行并发验证
-                batch_keys = random.sample(available_keys, min(batch_size, len(available_keys), target_size - len(self.valid_keys)))
-                logger.info(f"Preload batch: verifying {len(batch_keys)} keys")
-
-                # 并发验证
-                tasks = [self._verify_key_for_emergency(key) for key in batch_keys]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # 处理结果
-                batch_loaded = 0
-                for result in results:
-                    if isinstance(result, str):  # 验证成功
-                        # 检查是否达到目标大小
-                        if len(self.valid_keys) >= target_size:
-                            logger.info(f"Preload target size reached ({target_size}), stopping preload")
-                            break
-
-                        key_obj = ValidKeyWithTTL(result, self.ttl_hours)
-                        self.valid_keys.append(key_obj)
-                        self._pool_keys_set.add(key_obj.key)
-                        batch_loaded += 1
-                        total_loaded += 1
-                        logger.info(f"Key {redact_key_for_logging(result)} preloaded successfully.")
-
-                logger.info(f"Preload batch completed: loaded {batch_loaded}/{len(batch_keys)} keys, pool size: {len(self.valid_keys)}")
-
-                if batch_loaded == 0:  # 如果这批全部失败，停止预加载
-                    logger.warning("Preload batch failed completely, stopping preload")
-                    break
+        # 获取可用密钥：从不在池中的候选集合出发，一次同步批量检查可用性
+        available_keys = self.key_manager.filter_keys_available_for_verification(self._refill_candidates)
 
-        logger.info(f"Pool preload completed. Loaded {len(self.valid_keys)} keys")
+        if not available_keys:
+            logger.warning("No more valid keys available for preload")
+        else:
+            random.shuffle(available_keys)
+            logger.info("Preload: verifying up to %d candidate keys", len(available_keys))
+
+            # 在途任务数限制为验证并发数的两倍：信号量始终有排队的验证可用，
+            # 又不必为成千上万的候选一次性创建任务；同时不超过距目标还差的密钥数，
+            # 避免结果注定被丢弃的验证消耗API配额。结果按完成顺序逐个入池，达到目标后取消其余任务
+            window = max(1, 2 * int(settings.CONCURRENT_VERIFICATIONS))
+            # 洗牌后从尾部逐个弹出候选，已取出的密钥立即释放引用，无需下标或重新筛选
+            candidates = (available_keys.pop() for _ in range(len(available_keys)))
+            pending = {asyncio.create_task(self._verify_key_for_emergency(key))
+                       for key in islice(candidates, min(window, max(0, target_size - len(self.valid_keys))))}
+            max_consecutive_failures = min(10, target_size)
+            consecutive_failures = 0
+            try:
+                # 直接以池的实际大小判断是否达标，预加载期间其他任务补充的密钥同样计入
+                while pending and len(self.valid_keys) < target_size and consecutive_failures < max_consecutive_failures:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        result = task.result()
+                        if result is None:  # 验证失败
+                            consecutive_failures += 1
+                            continue
+                        consecutive_failures = 0
+                        if self.append_key(ValidKeyWithTTL(result, self.ttl_hours)):
+                            logger.info("Key %s preloaded successfully.", redact_key_for_logging(result))
+                    # 补足窗口
+                    slots = min(window, target_size - len(self.valid_keys)) - len(pending)
+                    for key in islice(candidates, max(0, slots)):
+                        pending.add(asyncio.create_task(self._verify_key_for_emergency(key)))
+
+                if len(self.valid_keys) >= target_size:
+                    logger.info("Preload target size reached (%d), cancelling remaining verifications", target_size)
+                elif consecutive_failures >= max_consecutive_failures:
+                    logger.warning("Preload stopped after %d consecutive verification failures", consecutive_failures)
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+        pool_size_after = len(self.valid_keys)
+        logger.info("Pool preload completed. Loaded %s keys", pool_size_after)
 
         # 检查预加载后池大小是否低于最小阈值
         min_threshold = int(getattr(settings, 'POOL_MIN_THRESHOLD', 10))
-        if len(self.valid_keys) < min_threshold:
-            logger.warning(f"Pool size after preload ({len(self.valid_keys)}) is below the minimum threshold ({min_threshold}). "
-                           f"Triggering an emergency async refill.")
-            asyncio.create_task(self._persistent_emergency_refill())
+        if pool_size_after < min_threshold:
+            logger.warning("Pool size after preload (%s) is below the minimum threshold (%s). "
+                           "Triggering an emergency async refill.",
+                           pool_size_after, min_threshold)
+            self._schedule_emergency_refill()
 
-        return len(self.valid_keys)
+        return pool_size_after
 
     def log_performance_summary(self) -> None:
         """
         记录性能摘要日志
         """
-        stats = self.get_pool_stats()
+        # INFO级别关闭时不必计算统计信息
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        # 直接读取计数器属性，不构建 get_pool_stats 中的 stats/performance_stats 快照字典
+        rates = self.get_pool_rates()
+        avg_age, min_age, max_age = self._key_age_stats(time.monotonic())
+        avg_verification_time = (self._sum_verification_time / self._verification_samples
+                                 if self._verification_samples else 0.0)
 
         logger.info("=== ValidKeyPool Performance Summary ===")
-        logger.info(f"Pool Status: {stats['current_size']}/{stats['pool_size']} "
-                   f"({stats['utilization']:.1%} utilization)")
-        logger.info(f"Hit Rate: {stats['hit_rate']:.2%}, Miss Rate: {stats['miss_rate']:.2%}")
-        logger.info(f"Verification Success Rate: {stats['verification_success_rate']:.2%}")
-        logger.info(f"TTL Expiry Rate: {stats['ttl_expiry_rate']:.2%}")
-        logger.info(f"Average Key Age: {stats['avg_key_age_seconds']}s "
-                   f"(min: {stats['min_key_age_seconds']}s, max: {stats['max_key_age_seconds']}s)")
-        logger.info(f"Total Requests: {stats['stats']['hit_count'] + stats['stats']['miss_count']}")
-        logger.info(f"Pro Model Requests: {stats['stats']['pro_model_requests']}, "
-                   f"Non-Pro Model Requests: {stats['stats']['non_pro_model_requests']}")
-        logger.info(f"Usage Exhausted Keys Removed: {stats['stats']['usage_exhausted_keys_removed']}")
-        logger.info(f"Emergency Refills: {stats['stats']['emergency_refill_count']}")
-        logger.info(f"Maintenance Runs: {stats['stats']['maintenance_count']}")
-        logger.info(f"Average Verification Time: {stats['performance_stats']['avg_verification_time']:.3f}s")
+        logger.info("Pool Status: %s/%s "
+                   "(%.1f%% utilization)",
+                   len(self.valid_keys), self.pool_size, rates['utilization'] * 100)
+        logger.info("Hit Rate: %.2f%%, Miss Rate: %.2f%%", rates['hit_rate'] * 100, rates['miss_rate'] * 100)
+        logger.info("Verification Success Rate: %.2f%%", rates['verification_success_rate'] * 100)
+        logger.info("TTL Expiry Rate: %.2f%%", rates['ttl_expiry_rate'] * 100)
+        logger.info("Average Key Age: %ss "
+                   "(min: %ss, max: %ss)",
+                   avg_age, min_age, max_age)
+        logger.info("Total Requests: %s", self._total_requests)
+        logger.info("Pro Model Requests: %s, "
+                   "Non-Pro Model Requests: %s",
+                   self._pro_model_requests, self._non_pro_model_requests)
+        logger.info("Usage Exhausted Keys Removed: %s", self._usage_exhausted_keys_removed)
+        logger.info("Emergency Refills: %s", self._emergency_refill_count)
+        logger.info("Maintenance Runs: %s", self._maintenance_count)
+        logger.info("Average Verification Time: %.3fs", avg_verification_time)
         logger.info("========================================")
 
     def reset_stats(self) -> None:
@@ -927,27 +1510,5 @@ class ValidKeyPool:
         重置统计信息
         """
         logger.info("Resetting ValidKeyPool statistics")
-
-        self.stats = {
-            "hit_count": 0,
-            "miss_count": 0,
-            "emergency_refill_count": 0,
-            "expired_keys_removed": 0,
-            "total_verifications": 0,
-            "successful_verifications": 0,
-            "maintenance_count": 0,
-            "preload_count": 0,
-            "fallback_count": 0,
-            "verification_failures": 0,
-            "usage_exhausted_keys_removed": 0,  # 因使用次数耗尽而移除的密钥数
-            "pro_model_requests": 0,  # Pro模型请求数
-            "non_pro_model_requests": 0  # 非Pro模型请求数
-        }
-
-        self.performance_stats = {
-            "last_hit_time": None,
-            "last_miss_time": None,
-            "last_maintenance_time": None,
-            "total_get_key_calls": 0,
-            "avg_verification_time": 0.0
-        }
+        self._init_stats()
+        self._stats_cache.remove("stats")
@@ -2,8 +2,10 @@
 TTL缓存工具类模块
 基于现有ProxyCheckService的缓存模式实现通用TTL缓存功能
 """
+import heapq
+import logging
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from app.log.logger import get_config_logger
 
 logger = get_config_logger()
@@ -14,6 +16,9 @@ class TTLCache:
     通用TTL（生存时间）缓存类
     
     提供基于时间的缓存管理功能，支持自动过期清理和统计信息
+
+    使用单调时钟计时，不受系统时间调整影响。缓存项保存预先计算的过期时间，
+    另以最小堆按过期时间索引，过期项在 get/put 时惰性清理，无需全量扫描。
     """
     
     def __init__(self, ttl_seconds: int):
@@ -23,8 +28,32 @@ class TTLCache:
         Args:
             ttl_seconds: 缓存项的生存时间（秒）
         """
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._cache: Dict[str, Tuple[Any, float]] = {}  # key -> (value, 过期的单调时钟时间)
+        self._expiry_heap: List[Tuple[float, str]] = []  # (过期时间, key)，可能包含已失效的旧条目
         self.ttl_seconds = ttl_seconds
+
+    def _purge_expired(self, now: float) -> int:
+        """
+        弹出堆顶所有已过期的条目并删除对应缓存项
+
+        堆中的旧条目（键已被覆盖或移除）只有过期时间与缓存中一致时才会删除缓存项。
+
+        Args:
+            now: 当前单调时钟时间
+
+        Returns:
+            删除的缓存项数量
+        """
+        heap = self._expiry_heap
+        cache = self._cache
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = cache.get(key)
+            if entry is not None and entry[1] == expiry:
+                del cache[key]
+                removed += 1
+        return removed
         
     def get(self, key: str) -> Optional[Any]:
         """
@@ -36,18 +65,15 @@ class TTLCache:
         Returns:
             缓存值，如果不存在或已过期则返回None
         """
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            # 检查缓存是否过期
-            if time.time() - timestamp < self.ttl_seconds:
-                logger.debug(f"Cache hit for key: {key}")
-                return value
-            else:
-                # 移除过期缓存
-                del self._cache[key]
-                logger.debug(f"Cache expired and removed for key: {key}")
-        
-        logger.debug(f"Cache miss for key: {key}")
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+
+        # 未命中或已过期：顺带清理所有已到期的缓存项
+        self._purge_expired(now)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache miss for key: {key}")
         return None
     
     def put(self, key: str, value: Any) -> None:
@@ -58,8 +84,17 @@ class TTLCache:
             key: 缓存键
             value: 缓存值
         """
-        self._cache[key] = (value, time.time())
-        logger.debug(f"Cache stored for key: {key}")
+        now = time.monotonic()
+        self._purge_expired(now)
+        expiry = now + self.ttl_seconds
+        self._cache[key] = (value, expiry)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        if len(self._expiry_heap) > 2 * len(self._cache) + 16:
+            # 旧条目过多时按当前缓存重建堆
+            self._expiry_heap = [(entry_expiry, entry_key) for entry_key, (_, entry_expiry) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache stored for key: {key}")
     
     def remove(self, key: str) -> bool:
         """
@@ -72,8 +107,10 @@ class TTLCache:
             是否成功移除
         """
         if key in self._cache:
+            # 堆中的对应条目留待过期时惰性丢弃
             del self._cache[key]
-            logger.debug(f"Cache removed for key: {key}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache removed for key: {key}")
             return True
         return False
     
@@ -84,20 +121,12 @@ class TTLCache:
         Returns:
             清理的缓存项数量
         """
-        current_time = time.time()
-        expired_keys = []
-        
-        for key, (_, timestamp) in self._cache.items():
-            if current_time - timestamp >= self.ttl_seconds:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
+        removed = self._purge_expired(time.monotonic())
         
-        if expired_keys:
-            logger.info(f"Removed {len(expired_keys)} expired cache items")
+        if removed:
+            logger.info(f"Removed {removed} expired cache items")
         
-        return len(expired_keys)
+        return removed
     
     def get_stats(self) -> Dict[str, int]:
         """
@@ -106,10 +135,10 @@ class TTLCache:
         Returns:
             包含缓存统计信息的字典
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         valid_cache_count = sum(
-            1 for _, timestamp in self._cache.values()
-            if current_time - timestamp < self.ttl_seconds
+            1 for _, expiry in self._cache.values()
+            if current_time < expiry
         )
         
         return {
@@ -123,6 +152,7 @@ class TTLCache:
         """清空所有缓存"""
         cache_count = len(self._cache)
         self._cache.clear()
+        self._expiry_heap.clear()
         logger.info(f"Cache cleared, removed {cache_count} items")
     
     def size(self) -> int:
@@ -154,5 +184,5 @@ class TTLCache:
         if key not in self._cache:
             return True
         
-        _, timestamp = self._cache[key]
-        return time.time() - timestamp >= self.ttl_seconds
+        _, expiry = self._cache[key]
+        return time.monotonic() >= expiry
@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -66,13 +67,14 @@ async def test_large_data():
     try:
         # 创建一个包含大量密钥的测试数据
         test_keys = [f"AIzaSyTest{i:04d}{'x' * 35}" for i in range(1500)]  # 1500个测试密钥
-        test_data = str(test_keys)
+        # 紧凑JSON：比 str(list) 更小，且可被标准工具解析
+        test_data = json.dumps(test_keys, separators=(",", ":"))
         
         print(f"测试数据大小: {len(test_data)} 字符")
         
         # 尝试插入或更新测试数据
         query = text("""
-            INSERT INTO t_settings (key, value, description) 
+            INSERT INTO t_settings (`key`, value, description) 
             VALUES ('TEST_LARGE_DATA', :value, 'Test large data storage')
             ON DUPLICATE KEY UPDATE value = :value
         """)
@@ -81,7 +83,7 @@ async def test_large_data():
         print("✅ 大数据存储测试成功")
         
         # 清理测试数据
-        cleanup_query = text("DELETE FROM t_settings WHERE key = 'TEST_LARGE_DATA'")
+        cleanup_query = text("DELETE FROM t_settings WHERE `key` = 'TEST_LARGE_DATA'")
         await database.execute(cleanup_query)
         print("✅ 测试数据已清理")
         
@@ -11,7 +11,7 @@ import sys
 import os
 
 # 添加项目路径到sys.path
-sys.path.insert(0, 'D:\\Programs\\gemini-balance')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.service.key.valid_key_pool import ValidKeyPool
 from app.service.key.key_manager import KeyManager
@@ -26,6 +26,8 @@ class EmergencyRefillTest:
         # 创建模拟的key_manager
         self.mock_key_manager = MagicMock()
         self.mock_key_manager.api_keys = [f"test_key_{i}" for i in range(20)]
+        # 补充候选集合由 key_failure_counts 中的密钥构成
+        self.mock_key_manager.key_failure_counts = {key: 0 for key in self.mock_key_manager.api_keys}
         
         # 模拟is_key_valid方法
         async def mock_is_key_valid(key):
@@ -44,6 +46,14 @@ class EmergencyRefillTest:
             return "fallback_key"
         
         self.mock_key_manager.get_next_working_key = mock_get_next_working_key
+        # 紧急补充直接走密钥列表轮询，避免经由 get_next_working_key 重新进入密钥池
+        self.mock_key_manager._original_get_next_working_key = mock_get_next_working_key
+
+        # 模拟同步批量可用性检查
+        def mock_filter_keys_available_for_verification(keys):
+            return [key for key in keys if self.mock_key_manager.key_failure_counts.get(key, 0) == 0]
+
+        self.mock_key_manager.filter_keys_available_for_verification = mock_filter_keys_available_for_verification
         
         # 模拟reset_key_failure_count方法
         self.mock_key_manager.reset_key_failure_count = AsyncMock()
@@ -76,6 +86,12 @@ class EmergencyRefillTest:
         """模拟并发紧急补充请求"""
         print(f"\n🚨 开始模拟 {num_requests} 个并发紧急补充请求...")
         
+        # 等待上一场景遗留的后台补充任务结束（可能处于失败重试的等待中），避免新场景的请求并入旧任务
+        previous_task = self.pool._emergency_refill_task
+        if previous_task is not None and not previous_task.done():
+            previous_task.cancel()
+            await asyncio.gather(previous_task, return_exceptions=True)
+
         # 清空池子，确保从空池开始
         self.pool.clear_pool()
         initial_count = self.pool.stats["emergency_refill_count"]
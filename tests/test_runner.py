@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+测试运行入口
+发现并运行 tests 目录下的全部单元测试
+"""
+import os
+import sys
+import unittest
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+os.environ.setdefault("DATABASE_TYPE", "sqlite")
+
+
+def main() -> int:
+    """运行全部测试，返回进程退出码"""
+    suite = unittest.defaultTestLoader.discover(os.path.dirname(os.path.abspath(__file__)), top_level_dir=project_root)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+TTLCache 单元测试
+"""
+import unittest
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """可手动推进的单调时钟"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TTLCacheTestCase(unittest.TestCase):
+    """以假时钟替换 time.monotonic 的 TTLCache 测试基类"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("app.utils.ttl_cache.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = TTLCache(ttl_seconds=10)
+
+
+class TestExpiry(TTLCacheTestCase):
+    """缓存项在 TTL 到期后失效并被惰性清理"""
+
+    def test_value_expires_after_ttl(self):
+        self.cache.put("a", 1)
+        self.clock.advance(9.9)
+        self.assertEqual(self.cache.get("a"), 1)
+
+        self.clock.advance(0.1)
+        self.assertTrue(self.cache.is_expired("a"))
+        self.assertIsNone(self.cache.get("a"))
+        self.assertFalse(self.cache.contains("a"))
+
+    def test_overwrite_extends_expiry(self):
+        self.cache.put("a", 1)
+        self.clock.advance(5)
+        self.cache.put("a", 2)
+        self.clock.advance(6)
+
+        # 旧的堆条目到期时不能删除覆盖后的新值
+        self.assertEqual(self.cache.get("a"), 2)
+        self.assertEqual(self.cache.remove_expired(), 0)
+        self.clock.advance(4)
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_put_purges_other_expired_items(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.clock.advance(10)
+        self.cache.put("c", 3)
+
+        self.assertEqual(self.cache.size(), 1)
+        self.assertEqual(self.cache.get_stats()["expired_cached"], 0)
+
+
+class TestHeapRebuild(TTLCacheTestCase):
+    """反复覆盖同一键产生的旧堆条目过多时，按当前缓存重建堆"""
+
+    def test_stale_heap_entries_are_compacted(self):
+        for i in range(17):
+            self.cache.put("a", i)
+        # 1 个缓存项最多容忍 2 * 1 + 16 个堆条目，第 19 次写入触发重建
+        self.assertEqual(len(self.cache._expiry_heap), 17)
+        self.cache.put("a", 17)
+        self.assertEqual(len(self.cache._expiry_heap), 18)
+        self.cache.put("a", 18)
+        self.assertEqual(self.cache._expiry_heap, [(self.clock.now + 10, "a")])
+        self.assertEqual(self.cache.get("a"), 18)
+
+    def test_rebuilt_heap_still_expires_items(self):
+        for i in range(30):
+            self.clock.advance(0.01)
+            self.cache.put(f"k{i % 2}", i)
+        self.clock.advance(10)
+
+        self.assertEqual(self.cache.remove_expired(), 2)
+        self.assertEqual(self.cache.size(), 0)
+        self.assertEqual(self.cache._expiry_heap, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
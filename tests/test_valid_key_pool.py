@@ -0,0 +1,285 @@
+"""
+ValidKeyPool 单元测试
+"""
+import asyncio
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("DATABASE_TYPE", "sqlite")
+
+from app.config.config import settings
+from app.service.key.key_manager import KeyManager
+from app.service.key.valid_key_models import ValidKeyWithTTL
+from app.service.key.valid_key_pool import ValidKeyPool, clear_model_caches
+
+
+class FakeChatService:
+    """只记录调用次数、总是验证成功的聊天服务"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, model, request, key):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {}
+
+
+class PoolTestCase(unittest.IsolatedAsyncioTestCase):
+    """创建带有效密钥池的 KeyManager，并在结束时取消池的后台任务"""
+
+    key_count = 20
+
+    async def asyncSetUp(self):
+        self.keys = [f"AIzaTestKey{i:04d}" for i in range(self.key_count)]
+        self.key_manager = KeyManager(self.keys, [])
+        self.chat_service = FakeChatService()
+        self.key_manager.set_chat_service(self.chat_service)
+        self.pool = self.key_manager.valid_key_pool
+        self.assertIsNotNone(self.pool)
+
+    async def asyncTearDown(self):
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class TestEmergencyRefillRecursion(PoolTestCase):
+    """池为空时的紧急补充不能重新进入密钥池"""
+
+    async def test_empty_pool_miss_does_not_reenter_pool(self):
+        self.assertEqual(len(self.pool.valid_keys), 0)
+        original = self.key_manager.get_next_working_key
+        with patch.object(self.key_manager, "get_next_working_key", wraps=original) as wrapped:
+            key = await self.key_manager.get_next_working_key("gemini-2.5-flash")
+
+        self.assertIn(key, self.keys)
+        # 紧急补充直接走密钥列表轮询，get_next_working_key 只被外部调用一次
+        self.assertEqual(wrapped.call_count, 1)
+        self.assertEqual(self.pool.stats["miss_count"], 1)
+
+
+def make_key_obj(key: str, expires_in: float) -> ValidKeyWithTTL:
+    """创建指定剩余寿命（秒）的密钥对象"""
+    key_obj = ValidKeyWithTTL(key, ttl_hours=2)
+    key_obj.expires_at_monotonic = time.monotonic() + expires_in
+    return key_obj
+
+
+class TestWarmSpares(PoolTestCase):
+    """池满淘汰下来的密钥作为备用密钥在未命中时使用"""
+
+    async def test_evicted_key_is_served_on_miss(self):
+        self.pool.pool_size = 2
+        self.assertTrue(self.pool.append_key(make_key_obj(self.keys[0], 100)))
+        self.assertTrue(self.pool.append_key(make_key_obj(self.keys[1], 200)))
+        self.assertTrue(self.pool.append_key(make_key_obj(self.keys[2], 300)))
+        self.assertNotIn(self.keys[0], self.pool.valid_keys)
+
+        # 清空池中剩余密钥，下一次获取将未命中
+        self.pool.remove_key(self.keys[1])
+        self.pool.remove_key(self.keys[2])
+        with patch.object(ValidKeyPool, "emergency_refill") as emergency_refill:
+            key = await self.pool.get_valid_key("gemini-2.5-flash")
+        self.assertEqual(key, self.keys[0])
+        emergency_refill.assert_not_called()
+
+    async def test_removed_key_is_dropped_from_spares(self):
+        self.pool.pool_size = 1
+        self.pool.append_key(make_key_obj(self.keys[0], 100))
+        self.pool.append_key(make_key_obj(self.keys[1], 200))
+        self.assertEqual([spare.key for spare in self.pool._warm_spares], [self.keys[0]])
+
+        self.pool.remove_key(self.keys[0])
+        self.assertEqual(len(self.pool._warm_spares), 0)
+        self.assertIn(self.keys[0], self.pool._refill_candidate_index)
+
+    async def test_spare_is_not_a_refill_candidate(self):
+        self.pool.pool_size = 1
+        self.pool.append_key(make_key_obj(self.keys[0], 100))
+        self.pool.append_key(make_key_obj(self.keys[1], 200))
+
+        # 备用密钥不会被补充流程抽中重复验证
+        self.assertNotIn(self.keys[0], self.pool._refill_candidate_index)
+        self.pool._reset_refill_candidates()
+        self.assertNotIn(self.keys[0], self.pool._refill_candidate_index)
+
+    async def test_spare_at_usage_limit_is_not_returned_to_pool(self):
+        self.pool.pool_size = 1
+        spare = make_key_obj(self.keys[0], 100)
+        spare.usage_count = 4
+        self.pool.append_key(spare)
+        self.pool.append_key(make_key_obj(self.keys[1], 200))
+        self.pool.remove_key(self.keys[1])
+
+        self.addCleanup(clear_model_caches)
+        with patch.object(settings, "PRO_MODEL_MAX_USAGE", 5), \
+                patch.object(ValidKeyPool, "_schedule_emergency_refill"):
+            clear_model_caches()
+            key = await self.pool.get_valid_key("gemini-2.5-pro")
+
+        self.assertEqual(key, self.keys[0])
+        self.assertNotIn(self.keys[0], self.pool.valid_keys)
+        self.assertIn(self.keys[0], self.pool._refill_candidate_index)
+
+
+class TestFullPoolEviction(PoolTestCase):
+    """池满时按过期时间淘汰：先淘汰最早过期的密钥，不比它更新鲜的新密钥被拒绝"""
+
+    async def test_soonest_expiring_key_is_evicted_first(self):
+        self.pool.pool_size = 3
+        for key, expires_in in zip(self.keys[:3], (300, 100, 200)):
+            self.assertTrue(self.pool.append_key(make_key_obj(key, expires_in)))
+
+        self.assertTrue(self.pool.append_key(make_key_obj(self.keys[3], 400)))
+        self.assertEqual(list(self.pool.valid_keys), [self.keys[0], self.keys[2], self.keys[3]])
+
+        self.assertTrue(self.pool.append_key(make_key_obj(self.keys[4], 500)))
+        self.assertEqual(list(self.pool.valid_keys), [self.keys[0], self.keys[3], self.keys[4]])
+        self.assertEqual(self.pool._ttl_evictions, 2)
+
+    async def test_newcomer_expiring_sooner_is_rejected(self):
+        self.pool.pool_size = 2
+        self.pool.append_key(make_key_obj(self.keys[0], 200))
+        self.pool.append_key(make_key_obj(self.keys[1], 300))
+
+        self.assertFalse(self.pool.append_key(make_key_obj(self.keys[2], 100)))
+        self.assertEqual(list(self.pool.valid_keys), [self.keys[0], self.keys[1]])
+        self.assertEqual(self.pool._ttl_evictions, 0)
+
+
+class TestVerificationCoalescing(PoolTestCase):
+    """同一密钥的并发验证只执行一次，等待方共享执行方的结果"""
+
+    async def test_concurrent_waiters_share_result(self):
+        release = asyncio.Event()
+        calls = []
+
+        async def verify(key):
+            calls.append(key)
+            await release.wait()
+            return True
+
+        key = self.keys[0]
+        tasks = [asyncio.create_task(self.pool._coalesce_verification(key, verify)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*tasks), [True] * 5)
+        self.assertEqual(calls, [key])
+        self.assertNotIn(key, self.pool._verification_futures)
+
+    async def test_runner_exception_propagates_to_waiters(self):
+        release = asyncio.Event()
+
+        async def verify(key):
+            await release.wait()
+            raise RuntimeError("upstream error")
+
+        key = self.keys[0]
+        runner = asyncio.create_task(self.pool._coalesce_verification(key, verify))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(self.pool._coalesce_verification(key, verify)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        with self.assertRaises(RuntimeError):
+            await runner
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertNotIn(key, self.pool._verification_futures)
+
+    async def test_cancelled_runner_makes_waiter_verify_again(self):
+        calls = []
+
+        async def verify(key):
+            calls.append(key)
+            if len(calls) == 1:
+                # 执行方的验证一直挂起，直到被取消
+                await asyncio.Event().wait()
+            return True
+
+        key = self.keys[0]
+        runner = asyncio.create_task(self.pool._coalesce_verification(key, verify))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.pool._coalesce_verification(key, verify))
+        await asyncio.sleep(0)
+
+        runner.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await runner
+        # 等待方不会把未完成的验证当作失败，而是自己重新验证
+        self.assertTrue(await waiter)
+        self.assertEqual(calls, [key, key])
+        self.assertNotIn(key, self.pool._verification_futures)
+
+    async def test_cancelled_waiter_does_not_affect_runner(self):
+        release = asyncio.Event()
+
+        async def verify(key):
+            await release.wait()
+            return True
+
+        key = self.keys[0]
+        runner = asyncio.create_task(self.pool._coalesce_verification(key, verify))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.pool._coalesce_verification(key, verify))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        self.assertTrue(await runner)
+
+class TestStringSettings(unittest.IsolatedAsyncioTestCase):
+    """配置编辑器提交的字符串配置值不会导致密钥池初始化失败"""
+
+    async def test_pool_builds_from_string_concurrency(self):
+        with patch.object(settings, "CONCURRENT_VERIFICATIONS", "3"):
+            key_manager = KeyManager([f"AIzaTestKey{i:04d}" for i in range(5)], [])
+            self.assertIsNotNone(key_manager.valid_key_pool)
+            self.assertEqual(settings.CONCURRENT_VERIFICATIONS, 3)
+        semaphore = key_manager.valid_key_pool.verification_semaphore
+        for _ in range(3):
+            await semaphore.acquire()
+        self.assertTrue(semaphore.locked())
+
+
+class TestPoolStatsCache(PoolTestCase):
+    """get_pool_stats 返回的字典（包括嵌套字典）修改后不影响缓存"""
+
+    async def test_mutating_result_does_not_touch_cache(self):
+        first = self.pool.get_pool_stats()
+        first["current_size"] = -1
+        first["stats"]["hit_count"] = -1
+        first["performance_stats"]["total_get_key_calls"] = -1
+
+        second = self.pool.get_pool_stats()
+        self.assertEqual(second["current_size"], 0)
+        self.assertEqual(second["stats"]["hit_count"], 0)
+        self.assertEqual(second["performance_stats"]["total_get_key_calls"], 0)
+
+
+class TestPoolRates(PoolTestCase):
+    """已返回的不同密钥数量精确计数，并据此计算理论最高命中率"""
+
+    async def test_served_key_cardinality_counts_distinct_keys(self):
+        self.pool.append_key(make_key_obj(self.keys[0], 100))
+        for _ in range(4):
+            self.assertEqual(await self.pool.get_valid_key("gemini-2.5-flash"), self.keys[0])
+
+        rates = self.pool.get_pool_rates()
+        self.assertEqual(rates["served_key_cardinality"], 1)
+        self.assertAlmostEqual(rates["theoretical_max_hit_rate"], 0.75)
+
+        self.pool.reset_stats()
+        self.assertEqual(self.pool.get_pool_rates()["served_key_cardinality"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()